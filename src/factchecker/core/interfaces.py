@@ -1,7 +1,7 @@
 """Abstract base interfaces for FactChecker components."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Mapping, Optional
 from .models import ExtractedClaim, SearchResult, FactCheckResponse
 
 
@@ -26,8 +26,14 @@ class BaseSearcher(ABC):
     """Abstract base for all searchers (Twitter, BlueSky, etc.)."""
 
     @abstractmethod
-    async def search(self, claim: str, query_params: dict) -> List[SearchResult]:
-        """Search external source for results."""
+    async def search(
+        self, claim: str, query_params: Mapping[str, str]
+    ) -> List[SearchResult]:
+        """Search external source for results.
+
+        query_params is shared by concurrent searches of the same claim and
+        is read-only.
+        """
         pass
 
     @property
@@ -3,7 +3,7 @@
 from typing import Optional, List, Literal
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
 
 
 class FactCheckRequest(BaseModel):
@@ -18,6 +18,11 @@ class FactCheckRequest(BaseModel):
     source_platform: str = "whatsapp"
     request_id: Optional[str] = None
 
+    # Cache key memoized by the pipeline so it is hashed once per request
+    _cache_key: Optional[str] = PrivateAttr(default=None)
+    # Image digest shared by the cache key and image processing
+    _image_digest: Optional[bytes] = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def at_least_one_required(self):
         """Validate that at least one input is provided."""
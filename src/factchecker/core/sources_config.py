@@ -24,6 +24,7 @@ class SourceConfig(BaseModel):
     class_name: str
     display_name: str
     sequence: int  # Lower values are checked earlier in the default order; negative values are skipped
+    search_timeout_s: float = 10.0  # Wall-clock bound on a single search call
 
 
 EXTERNAL_SOURCES: dict[str, SourceConfig] = {
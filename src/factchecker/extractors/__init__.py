@@ -3,13 +3,14 @@
 from .text_extractor import TextExtractor
 from .image_extractor import ImageExtractor
 from .claim_combiner import ClaimCombiner
-from .image_handler import ImageHandler
+from .image_handler import ImageAnalysis, ImageHandler
 from .text_image_extractor import TextImageExtractor
 
 __all__ = [
     "TextExtractor",
     "ImageExtractor",
     "ClaimCombiner",
+    "ImageAnalysis",
     "ImageHandler",
     "TextImageExtractor",
 ]
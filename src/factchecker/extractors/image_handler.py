@@ -1,14 +1,59 @@
 """Image handler for detecting text images and nested images."""
 
-from typing import Tuple
+import asyncio
+from typing import Optional, Tuple
+
+from pydantic import BaseModel
+
 from factchecker.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+class ImageAnalysis(BaseModel):
+    """Everything the pipeline needs to know about an input image."""
+
+    is_text_image: bool
+    has_nested: bool
+    top: Optional[bytes] = None  # Set only for nested images
+    inside: Optional[bytes] = None  # Set only for nested images
+
+
 class ImageHandler:
     """Handles image processing including nested image detection and separation."""
 
+    async def analyze(self, image_data: bytes) -> ImageAnalysis:
+        """Run text detection, nesting detection and separation in one call.
+
+        Callers get every derived product from a single pass, so the image
+        does not need to be inspected (or decoded) once per question.
+
+        Args:
+            image_data: Raw image bytes to analyze
+
+        Returns:
+            ImageAnalysis; top/inside are set only when has_nested is True
+
+        Raises:
+            ValueError: If image separation fails
+        """
+        # Both detectors read the same bytes independently, so run them
+        # concurrently rather than one after the other
+        is_text_image, has_nested = await asyncio.gather(
+            self.detect_text_image(image_data),
+            self.detect_nested_image(image_data),
+        )
+        if not is_text_image:
+            return ImageAnalysis(is_text_image=False, has_nested=False)
+
+        if not has_nested:
+            return ImageAnalysis(is_text_image=True, has_nested=False)
+
+        top, inside = await self.separate_nested_image(image_data)
+        return ImageAnalysis(
+            is_text_image=True, has_nested=True, top=top, inside=inside
+        )
+
     async def detect_text_image(self, image_data: bytes) -> bool:
         """Check if image contains readable text (is a 'text image').
         
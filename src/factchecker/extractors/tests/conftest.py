@@ -1,6 +1,113 @@
 """Pytest configuration for extractor tests."""
 
+import json
+from collections import OrderedDict
+from typing import Final
+from unittest.mock import patch
+
+import pytest
 from dotenv import load_dotenv
 
+from factchecker.extractors.text_extractor import TextExtractor
+
 # Load environment variables from .env file before any tests run
 load_dotenv()
+
+_PROVIDER_PATH = "factchecker.extractors.text_extractor.GoogleGeminiProvider"
+
+# Canned LLM payload for claim decomposition
+_MOCK_LLM_DICT: Final[dict] = {
+    "who": {
+        "value": "the sky",
+        "confidence": 0.9,
+        "is_ambiguous": False,
+        "is_unknown": False,
+    },
+    "what": {
+        "value": "is blue",
+        "confidence": 0.95,
+        "is_ambiguous": False,
+        "is_unknown": False,
+    },
+    "when": {
+        "value": "unknown",
+        "confidence": 0.0,
+        "is_ambiguous": False,
+        "is_unknown": True,
+    },
+    "where": {
+        "value": "unknown",
+        "confidence": 0.0,
+        "is_ambiguous": False,
+        "is_unknown": True,
+    },
+    "how": {
+        "value": "unknown",
+        "confidence": 0.0,
+        "is_ambiguous": False,
+        "is_unknown": True,
+    },
+    "why": {
+        "value": "unknown",
+        "confidence": 0.0,
+        "is_ambiguous": False,
+        "is_unknown": True,
+    },
+    "key_assertions": ["The sky is blue"],
+    "overall_confidence": 0.85,
+    "reasoning": "Simple factual claim about sky color",
+}
+
+# Serialized once at import; every stubbed call returns this same string
+_MOCK_LLM_RESPONSE: Final[str] = json.dumps(_MOCK_LLM_DICT, separators=(",", ":"))
+
+
+class _StubGemini:
+    """Plain async stand-in for GoogleGeminiProvider.
+
+    Much cheaper than AsyncMock because it records no call history; use
+    AsyncMock only in tests that assert on how the provider was called.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def call(self, *args, **kwargs):
+        return _MOCK_LLM_RESPONSE
+
+
+@pytest.fixture
+def mock_llm_response():
+    """Mock LLM response for claim decomposition."""
+    return _MOCK_LLM_RESPONSE
+
+
+@pytest.fixture(autouse=True)
+def stub_gemini_provider(request):
+    """Stub the LLM provider for every test except real-LLM integration tests.
+
+    The shared TextExtractor._provider and _llm_cache are reset too, so a stub
+    or result cached by one test never leaks into another.
+    """
+    if request.node.get_closest_marker("integration"):
+        yield None
+        return
+    with (
+        patch(_PROVIDER_PATH) as MockProvider,
+        patch.object(TextExtractor, "_provider", None),
+        patch.object(TextExtractor, "_llm_cache", OrderedDict()),
+    ):
+        MockProvider.side_effect = _StubGemini
+        yield MockProvider
+
+
+@pytest.fixture(scope="module")
+def stub_gemini_provider_module():
+    """Module-scoped variant of stub_gemini_provider for module-scoped fixtures."""
+    with (
+        patch(_PROVIDER_PATH) as MockProvider,
+        patch.object(TextExtractor, "_provider", None),
+        patch.object(TextExtractor, "_llm_cache", OrderedDict()),
+    ):
+        MockProvider.side_effect = _StubGemini
+        yield MockProvider
@@ -0,0 +1,68 @@
+"""Tests for ImageHandler."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from factchecker.extractors.image_handler import ImageAnalysis, ImageHandler
+
+
+@pytest.fixture
+def handler():
+    return ImageHandler()
+
+
+@pytest.mark.asyncio
+async def test_analyze_plain_text_image(handler):
+    """Test the placeholder detectors report a simple text image."""
+    analysis = await handler.analyze(b"fake_image_data")
+
+    assert analysis == ImageAnalysis(is_text_image=True, has_nested=False)
+
+
+@pytest.mark.asyncio
+async def test_analyze_non_text_image(handler):
+    """Test an image without text is reported as such, with no halves."""
+    with patch.object(handler, "detect_text_image", return_value=False):
+        analysis = await handler.analyze(b"fake_image_data")
+
+    assert analysis.is_text_image is False
+    assert analysis.top is None and analysis.inside is None
+
+
+@pytest.mark.asyncio
+async def test_analyze_nested_image_separates_halves(handler):
+    """Test a nested image comes back with its separated halves."""
+    with patch.object(
+        handler, "detect_nested_image", return_value=True
+    ), patch.object(
+        handler, "separate_nested_image", return_value=(b"top", b"inside")
+    ):
+        analysis = await handler.analyze(b"fake_image_data")
+
+    assert analysis.has_nested is True
+    assert (analysis.top, analysis.inside) == (b"top", b"inside")
+
+
+@pytest.mark.asyncio
+async def test_analyze_runs_detectors_concurrently(handler):
+    """Test both detectors are in flight at the same time."""
+    running = []
+    overlapped = []
+
+    def detector(result):
+        async def detect(image_data):
+            running.append(True)
+            await asyncio.sleep(0.01)
+            overlapped.append(len(running) == 2)
+            return result
+
+        return detect
+
+    with patch.object(
+        handler, "detect_text_image", side_effect=detector(True)
+    ), patch.object(handler, "detect_nested_image", side_effect=detector(False)):
+        await handler.analyze(b"fake_image_data")
+
+    assert overlapped == [True, True]
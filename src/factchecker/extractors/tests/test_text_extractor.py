@@ -1,134 +1,105 @@
 """Tests for TextExtractor."""
 
-import json
-import os
-from unittest.mock import AsyncMock, patch
+import re
+from typing import Final
 
 import pytest
+import pytest_asyncio
 
 from factchecker.extractors.text_extractor import TextExtractor
 from factchecker.core.models import ExtractedClaim
 
-# Check if API key is available for integration tests
-HAS_GEMINI_API_KEY = bool(os.getenv("GEMINI_API_KEY"))
+# Whitespace that must not survive normalization (one scan instead of four)
+_BAD_WS = re.compile(r"[\t\n\r]| {2}")
 
+# Shared immutable inputs
+_LONG_TEXT: Final[str] = "A" * TextExtractor.MAX_TEXT_LENGTH * 2
+_SPECIAL_CHARS_TEXT: Final[str] = "Café résumé naïve 🎉\t\n  multiple   spaces"
+_WS_ONLY: Final[str] = "   \t\n\r   "
 
-@pytest.fixture
-def extractor():
-    return TextExtractor()
-
-
-@pytest.fixture
-def mock_llm_response():
-    """Mock LLM response for claim decomposition."""
-    return json.dumps(
-        {
-            "who": {
-                "value": "the sky",
-                "confidence": 0.9,
-                "is_ambiguous": False,
-                "is_unknown": False,
-            },
-            "what": {
-                "value": "is blue",
-                "confidence": 0.95,
-                "is_ambiguous": False,
-                "is_unknown": False,
-            },
-            "when": {
-                "value": "unknown",
-                "confidence": 0.0,
-                "is_ambiguous": False,
-                "is_unknown": True,
-            },
-            "where": {
-                "value": "unknown",
-                "confidence": 0.0,
-                "is_ambiguous": False,
-                "is_unknown": True,
-            },
-            "how": {
-                "value": "unknown",
-                "confidence": 0.0,
-                "is_ambiguous": False,
-                "is_unknown": True,
-            },
-            "why": {
-                "value": "unknown",
-                "confidence": 0.0,
-                "is_ambiguous": False,
-                "is_unknown": True,
-            },
-            "key_assertions": ["The sky is blue"],
-            "overall_confidence": 0.85,
-            "reasoning": "Simple factual claim about sky color",
-        }
-    )
+_REQUIRED_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "text_length",
+        "original_text_length",
+        "word_count",
+        "sentence_count",
+        "encoding",
+        "normalized",
+        "has_image",
+    }
+)
 
 
 @pytest.fixture
-def long_text():
-    """Generate text exceeding MAX_TEXT_LENGTH."""
-    return "A" * 2000  # Exceeds MAX_TEXT_LENGTH of 1000
+def extractor():
+    return TextExtractor()
 
 
-@pytest.fixture
-def text_with_special_chars():
-    """Text with various special characters and Unicode."""
-    return "Café résumé naïve 🎉\t\n  multiple   spaces"
+# Inputs extracted once per module and shared by the normalization/metadata tests
+_NORMALIZATION_INPUTS = {
+    "whitespace_excess": "word1    word2\t\tword3\n\nword4",
+    "mixed_ws": "word1\tword2\nword3  word4\r\nword5",
+    "leading_trailing": "   \t\n  Hello World  \t\n  ",
+    "clean": "Clean text without issues",
+    "seven_words": "This is a test sentence with seven words",
+    "three_sentences": "First sentence. Second sentence! Third sentence?",
+}
 
 
-@pytest.fixture
-def whitespace_only_text():
-    """Text with only whitespace characters."""
-    return "   \t\n\r   "
+@pytest_asyncio.fixture(scope="module")
+async def extracted_results(stub_gemini_provider_module) -> dict[str, ExtractedClaim]:
+    """Run extract() once per canonical input and share the results."""
+    extractor = TextExtractor()
+    return {
+        key: await extractor.extract(claim_text=text, image_data=None)
+        for key, text in _NORMALIZATION_INPUTS.items()
+    }
 
 
 # Basic extraction tests
-@pytest.mark.asyncio
-async def test_text_extraction_basic(extractor, mock_llm_response):
-    """Test basic text extraction."""
-    with patch(
-        "factchecker.extractors.text_extractor.GoogleGeminiProvider"
-    ) as MockProvider:
-        mock_provider = AsyncMock()
-        mock_provider.call = AsyncMock(return_value=mock_llm_response)
-        MockProvider.return_value = mock_provider
-
-        result = await extractor.extract(claim_text="The sky is blue", image_data=None)
+class TestBasicExtraction:
+    """Extraction against the stubbed LLM provider from conftest."""
+
+    @pytest.mark.parametrize(
+        "claim,img,checks",
+        [
+            (
+                "The sky is blue",
+                None,
+                lambda r: r.claim_text == "The sky is blue"
+                and r.extracted_from == "text"
+                and len(r.questions) > 0,
+            ),
+            # TextExtractor only handles text, even when image data is supplied
+            (
+                "Verify this",
+                b"mock_image_data",
+                lambda r: r.metadata["has_image"] is True,
+            ),
+            (
+                "Test claim with length",
+                None,
+                lambda r: "text_length" in r.metadata
+                and r.metadata["text_length"] > 0,
+            ),
+        ],
+        ids=["basic", "hybrid", "metadata"],
+    )
+    async def test_text_extraction_with_mock_llm(self, extractor, claim, img, checks):
+        """Test extraction against a mocked LLM for text and hybrid inputs."""
+        result = await extractor.extract(claim_text=claim, image_data=img)
         assert isinstance(result, ExtractedClaim)
-        assert result.claim_text == "The sky is blue"
-        assert result.extracted_from == "text"
         assert result.raw_input_type == "text_only"
         assert 0 <= result.confidence <= 1
-        assert len(result.questions) > 0  # Should have extracted questions
+        assert checks(result)
 
 
-@pytest.mark.asyncio
 async def test_text_extraction_requires_input(extractor):
     """Test that extraction fails without input."""
     with pytest.raises(ValueError):
         await extractor.extract(claim_text=None, image_data=None)
 
 
-@pytest.mark.asyncio
-async def test_hybrid_extraction(extractor, mock_llm_response):
-    """Test extraction from both text and image."""
-    with patch(
-        "factchecker.extractors.text_extractor.GoogleGeminiProvider"
-    ) as MockProvider:
-        mock_provider = AsyncMock()
-        mock_provider.call = AsyncMock(return_value=mock_llm_response)
-        MockProvider.return_value = mock_provider
-
-        result = await extractor.extract(
-            claim_text="Verify this", image_data=b"mock_image_data"
-        )
-        assert result.raw_input_type == "text_only"  # TextExtractor only handles text
-        assert result.metadata["has_image"] is True
-
-
-@pytest.mark.asyncio
 async def test_image_only_extraction(extractor):
     """Test extraction from image only."""
     # TextExtractor currently requires text input
@@ -136,67 +107,136 @@ async def test_image_only_extraction(extractor):
         await extractor.extract(claim_text=None, image_data=b"mock_image_data")
 
 
-@pytest.mark.asyncio
-async def test_extraction_metadata(extractor, mock_llm_response):
-    """Test that metadata is populated."""
-    with patch(
-        "factchecker.extractors.text_extractor.GoogleGeminiProvider"
-    ) as MockProvider:
-        mock_provider = AsyncMock()
-        mock_provider.call = AsyncMock(return_value=mock_llm_response)
-        MockProvider.return_value = mock_provider
+async def test_llm_provider_shared_across_extractions(stub_gemini_provider):
+    """Test that the LLM provider is constructed once and reused."""
+    await TextExtractor().extract(claim_text="The first claim", image_data=None)
+    await TextExtractor().extract(claim_text="The second claim", image_data=None)
+    assert stub_gemini_provider.call_count == 1
 
-        result = await extractor.extract(
-            claim_text="Test claim with length", image_data=None
-        )
-        assert "text_length" in result.metadata
-        assert result.metadata["text_length"] > 0
 
+async def test_repeated_claim_served_from_llm_cache(
+    extractor, monkeypatch, mock_llm_response
+):
+    """Test that resubmitting the same claim reuses the cached LLM result."""
+    calls = []
+
+    class _CountingProvider:
+        async def call(self, *args, **kwargs):
+            calls.append(kwargs.get("prompt"))
+            return mock_llm_response
+
+    monkeypatch.setattr(TextExtractor, "_provider", _CountingProvider())
+    first = await extractor.extract(claim_text="The sky is blue", image_data=None)
+    second = await extractor.extract(claim_text="  The sky   is blue ", image_data=None)
+    assert calls == ["The sky is blue"]
+    assert second.questions == first.questions
+    assert second.confidence == first.confidence
 
-# Edge case tests
-@pytest.mark.asyncio
-async def test_empty_string_raises_error(extractor):
-    """Test that empty string after normalization raises ValueError."""
-    with pytest.raises(ValueError, match="empty or contains only whitespace"):
-        await extractor.extract(claim_text="", image_data=None)
 
+async def test_llm_cache_hit_unaffected_by_caller_mutation(
+    extractor, monkeypatch, mock_llm_response
+):
+    """Test that mutating returned questions does not change the cached result."""
 
-@pytest.mark.asyncio
-async def test_whitespace_only_raises_error(extractor, whitespace_only_text):
-    """Test that whitespace-only text raises ValueError."""
+    class _Provider:
+        async def call(self, *args, **kwargs):
+            return mock_llm_response
+
+    monkeypatch.setattr(TextExtractor, "_provider", _Provider())
+    first = await extractor.extract(claim_text="The sky is blue", image_data=None)
+    original_confidence = first.questions[0].confidence
+    first.questions[0].confidence = 1.0
+    first.segments.append("mutated")
+
+    second = await TextExtractor().extract(claim_text="The sky is blue", image_data=None)
+    assert second.questions[0] is not first.questions[0]
+    assert second.questions[0].confidence == original_confidence
+    assert "mutated" not in second.segments
+
+
+@pytest.mark.parametrize("text", ["Hi", "Sky blue", "12345 678 90", "?! ... !!"])
+async def test_trivial_input_skips_llm(extractor, stub_gemini_provider, text):
+    """Test that short or letter-free inputs are not sent to the LLM."""
+    result = await extractor.extract(claim_text=text, image_data=None)
+    assert stub_gemini_provider.call_count == 0
+    assert result.confidence == 0.0
+    assert result.questions == []
+
+
+@pytest.mark.parametrize(
+    "fenced",
+    [
+        "```json\n{body}\n```",
+        "```\n{body}\n```",
+        "```json\n{body}\n```\nLet me know if you need more detail.",
+        "{body}",
+    ],
+    ids=["json_fence", "bare_fence", "trailing_prose", "no_fence"],
+)
+async def test_llm_response_markdown_fences_stripped(
+    extractor, monkeypatch, mock_llm_response, fenced
+):
+    """Test that LLM JSON is parsed with or without a markdown code fence."""
+    response = fenced.replace("{body}", mock_llm_response)
+
+    class _FencedProvider:
+        async def call(self, *args, **kwargs):
+            return response
+
+    monkeypatch.setattr(TextExtractor, "_provider", _FencedProvider())
+    result = await extractor.extract(claim_text="The sky is blue", image_data=None)
+    assert result.confidence == 0.85
+    assert result.segments == ["The sky is blue"]
+
+
+# Edge case tests
+@pytest.mark.parametrize(
+    "text",
+    ["", _WS_ONLY, "\n\n\n", " ", "\t"],
+    ids=["empty", "mixed_whitespace", "newlines", "space", "tab"],
+)
+async def test_empty_or_whitespace_raises(extractor, text):
+    """Test that empty or whitespace-only text raises ValueError."""
     with pytest.raises(ValueError, match="empty or contains only whitespace"):
-        await extractor.extract(claim_text=whitespace_only_text, image_data=None)
+        await extractor.extract(claim_text=text, image_data=None)
 
 
-@pytest.mark.asyncio
-async def test_very_long_text_truncated(extractor, long_text):
+async def test_very_long_text_truncated(extractor):
     """Test that very long text is truncated to MAX_TEXT_LENGTH."""
-    result = await extractor.extract(claim_text=long_text, image_data=None)
+    result = await extractor.extract(claim_text=_LONG_TEXT, image_data=None)
     assert len(result.claim_text) == TextExtractor.MAX_TEXT_LENGTH
     assert result.metadata["truncated"] is True
-    assert result.metadata["original_text_length"] == 2000
+    assert result.metadata["original_text_length"] == len(_LONG_TEXT)
     assert result.metadata["text_length"] == TextExtractor.MAX_TEXT_LENGTH
 
 
-@pytest.mark.asyncio
-async def test_text_with_only_newlines_raises_error(extractor):
-    """Test that text with only newlines raises ValueError."""
-    with pytest.raises(ValueError, match="empty or contains only whitespace"):
-        await extractor.extract(claim_text="\n\n\n", image_data=None)
+async def test_oversized_text_pre_truncated(extractor):
+    """Test that input beyond PRE_TRUNCATE_LENGTH still truncates correctly."""
+    text = "word " * TextExtractor.PRE_TRUNCATE_LENGTH
+    result = await extractor.extract(claim_text=text, image_data=None)
+    assert result.claim_text == text[: TextExtractor.MAX_TEXT_LENGTH]
+    assert result.metadata["truncated"] is True
+    assert result.metadata["original_text_length"] == len(text)
+
+
+async def test_oversized_whitespace_padding_keeps_trailing_text(extractor):
+    """Test that text past a long whitespace run is kept when it fits."""
+    text = "start" + " " * TextExtractor.PRE_TRUNCATE_LENGTH + "end"
+    result = await extractor.extract(claim_text=text, image_data=None)
+    assert result.claim_text == "start end"
+    assert result.metadata["truncated"] is False
 
 
 # Special characters and encoding tests
-@pytest.mark.asyncio
-async def test_special_characters_handled(extractor, text_with_special_chars):
+async def test_special_characters_handled(extractor):
     """Test that special characters and Unicode are handled correctly."""
-    result = await extractor.extract(claim_text=text_with_special_chars, image_data=None)
+    result = await extractor.extract(claim_text=_SPECIAL_CHARS_TEXT, image_data=None)
     assert isinstance(result, ExtractedClaim)
     assert "Café" in result.claim_text
     assert "résumé" in result.claim_text
     assert "🎉" in result.claim_text
 
 
-@pytest.mark.asyncio
 async def test_unicode_normalization(extractor):
     """Test Unicode normalization (NFKC)."""
     # Using combining character for é
@@ -206,19 +246,6 @@ async def test_unicode_normalization(extractor):
     assert "é" in result.claim_text or "cafe" in result.claim_text
 
 
-@pytest.mark.asyncio
-async def test_mixed_whitespace_collapsed(extractor):
-    """Test that mixed whitespace (tabs, spaces, newlines) is collapsed."""
-    text = "word1\tword2\nword3  word4\r\nword5"
-    result = await extractor.extract(claim_text=text, image_data=None)
-    # Should have single spaces between words
-    assert "  " not in result.claim_text  # No double spaces
-    assert "\t" not in result.claim_text  # No tabs
-    assert "\n" not in result.claim_text  # No newlines
-    assert "\r" not in result.claim_text  # No carriage returns
-
-
-@pytest.mark.asyncio
 async def test_emoji_handling(extractor):
     """Test that emojis are preserved in normalized text."""
     text = "Hello 🎉 World 🌍 Test"
@@ -228,11 +255,16 @@ async def test_emoji_handling(extractor):
 
 
 # Text normalization tests
-@pytest.mark.asyncio
-async def test_whitespace_collapsing(extractor):
+def test_mixed_whitespace_collapsed(extracted_results):
+    """Test that mixed whitespace (tabs, spaces, newlines) is collapsed."""
+    result = extracted_results["mixed_ws"]
+    # Should have single spaces between words: no tabs, newlines, CRs or double spaces
+    assert _BAD_WS.search(result.claim_text) is None
+
+
+def test_whitespace_collapsing(extracted_results):
     """Test that excessive whitespace is collapsed to single spaces."""
-    text = "word1    word2\t\tword3\n\nword4"
-    result = await extractor.extract(claim_text=text, image_data=None)
+    result = extracted_results["whitespace_excess"]
     # Should have single spaces between words
     words = result.claim_text.split()
     assert len(words) == 4
@@ -242,17 +274,13 @@ async def test_whitespace_collapsing(extractor):
     assert "word4" in words
 
 
-@pytest.mark.asyncio
-async def test_leading_trailing_whitespace_removed(extractor):
+def test_leading_trailing_whitespace_removed(extracted_results):
     """Test that leading and trailing whitespace is removed."""
-    text = "   \t\n  Hello World  \t\n  "
-    result = await extractor.extract(claim_text=text, image_data=None)
+    result = extracted_results["leading_trailing"]
     assert result.claim_text == "Hello World"
-    assert not result.claim_text.startswith((" ", "\t", "\n"))
-    assert not result.claim_text.endswith((" ", "\t", "\n"))
+    assert result.claim_text.strip() == result.claim_text
 
 
-@pytest.mark.asyncio
 async def test_original_length_preserved_in_metadata(extractor):
     """Test that original text length is preserved in metadata."""
     original = "   Hello   World   "
@@ -262,77 +290,53 @@ async def test_original_length_preserved_in_metadata(extractor):
     assert result.metadata["text_length"] <= result.metadata["original_text_length"]
 
 
-@pytest.mark.asyncio
-async def test_normalized_flag_set(extractor):
+def test_normalized_flag_set(extracted_results):
     """Test that normalized flag is set when normalization is applied."""
     # Text with excessive whitespace should trigger normalization
-    text = "word1    word2\t\tword3"
-    result = await extractor.extract(claim_text=text, image_data=None)
+    result = extracted_results["whitespace_excess"]
     assert result.metadata["normalized"] is True
 
 
-@pytest.mark.asyncio
-async def test_normalized_flag_not_set_for_clean_text(extractor):
+def test_normalized_flag_not_set_for_clean_text(extracted_results):
     """Test that normalized flag is False when no normalization is needed."""
-    text = "Clean text without issues"
-    result = await extractor.extract(claim_text=text, image_data=None)
+    result = extracted_results["clean"]
     # May or may not be normalized (strip might always apply), but should be consistent
     assert "normalized" in result.metadata
 
 
 # Metadata validation tests
-@pytest.mark.asyncio
-async def test_word_count_accuracy(extractor):
+def test_word_count_accuracy(extracted_results):
     """Test that word_count is accurate."""
-    text = "This is a test sentence with seven words"
-    result = await extractor.extract(claim_text=text, image_data=None)
+    result = extracted_results["seven_words"]
     assert result.metadata["word_count"] == 8  # "seven" counts as one word
 
 
-@pytest.mark.asyncio
-async def test_sentence_count_approximation(extractor):
+def test_sentence_count_approximation(extracted_results):
     """Test that sentence_count is approximately correct."""
-    text = "First sentence. Second sentence! Third sentence?"
-    result = await extractor.extract(claim_text=text, image_data=None)
+    result = extracted_results["three_sentences"]
     assert result.metadata["sentence_count"] >= 3
 
 
-@pytest.mark.asyncio
-async def test_sentence_count_single_sentence(extractor):
+def test_sentence_count_single_sentence(extracted_results):
     """Test that single sentence without punctuation defaults to 1."""
-    text = "This is a single sentence without ending punctuation"
-    result = await extractor.extract(claim_text=text, image_data=None)
+    result = extracted_results["seven_words"]
     assert result.metadata["sentence_count"] == 1
 
 
-@pytest.mark.asyncio
-async def test_all_metadata_fields_present(extractor):
+def test_all_metadata_fields_present(extracted_results):
     """Test that all expected metadata fields are present."""
-    text = "Test claim for metadata validation"
-    result = await extractor.extract(claim_text=text, image_data=None)
-    required_fields = [
-        "text_length",
-        "original_text_length",
-        "word_count",
-        "sentence_count",
-        "encoding",
-        "normalized",
-        "has_image",
-    ]
-    for field in required_fields:
-        assert field in result.metadata, f"Missing metadata field: {field}"
+    result = extracted_results["clean"]
+    missing = _REQUIRED_FIELDS - result.metadata.keys()
+    assert not missing, f"Missing metadata fields: {sorted(missing)}"
 
 
-@pytest.mark.asyncio
-async def test_encoding_field_present(extractor):
+def test_encoding_field_present(extracted_results):
     """Test that encoding field is present and set."""
-    text = "Test text"
-    result = await extractor.extract(claim_text=text, image_data=None)
+    result = extracted_results["clean"]
     assert "encoding" in result.metadata
     assert result.metadata["encoding"] == "utf-8"
 
 
-@pytest.mark.asyncio
 async def test_has_image_metadata(extractor):
     """Test that has_image metadata is correctly set."""
     # With image
@@ -345,9 +349,12 @@ async def test_has_image_metadata(extractor):
     result_no_image = await extractor.extract(claim_text="Test", image_data=None)
     assert result_no_image.metadata["has_image"] is False
 
+    # Empty image payload counts as no image
+    result_empty_image = await extractor.extract(claim_text="Test", image_data=b"")
+    assert result_empty_image.metadata["has_image"] is False
+
 
 # Encoding error handling tests
-@pytest.mark.asyncio
 async def test_text_with_zero_width_spaces(extractor):
     """Test handling of zero-width spaces and other special Unicode."""
     # Zero-width space (U+200B)
@@ -358,7 +365,24 @@ async def test_text_with_zero_width_spaces(extractor):
     assert len(result.claim_text) > 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Hello\u200bWorld", "HelloWorld"),
+        ("\ufeffByte order mark", "Byte order mark"),
+        ("soft\u00adhyphen \u2066isolated\u2069", "softhyphen isolated"),
+        # ZWJ joins emoji sequences and must survive
+        ("Family \U0001F468\u200d\U0001F469", "Family \U0001F468\u200d\U0001F469"),
+    ],
+    ids=["zero_width_space", "bom", "soft_hyphen_bidi", "zwj_kept"],
+)
+async def test_invisible_format_characters_removed(extractor, text, expected):
+    """Test that invisible format characters are stripped during normalization."""
+    result = await extractor.extract(claim_text=text, image_data=None)
+    assert result.claim_text == expected
+    assert result.metadata["normalized"] is (text != expected)
+
+
 async def test_minimum_length_validation(extractor):
     """Test that text meeting minimum length is accepted."""
     text = "A"  # Single character, meets MIN_TEXT_LENGTH = 1
@@ -367,7 +391,6 @@ async def test_minimum_length_validation(extractor):
     assert result.metadata["text_length"] == 1
 
 
-@pytest.mark.asyncio
 async def test_maximum_length_boundary(extractor):
     """Test that text at maximum length is accepted without truncation."""
     text = "A" * TextExtractor.MAX_TEXT_LENGTH
@@ -376,161 +399,8 @@ async def test_maximum_length_boundary(extractor):
     assert result.metadata["truncated"] is False
 
 
-@pytest.mark.asyncio
-async def test_truncation_metadata(extractor, long_text):
+async def test_truncation_metadata(extractor):
     """Test that truncation metadata is correctly set."""
-    result = await extractor.extract(claim_text=long_text, image_data=None)
+    result = await extractor.extract(claim_text=_LONG_TEXT, image_data=None)
     assert result.metadata["truncated"] is True
     assert result.metadata["original_text_length"] > result.metadata["text_length"]
-
-
-# Integration tests with real LLM API
-@pytest.mark.skipif(
-    not HAS_GEMINI_API_KEY, reason="GEMINI_API_KEY not set in environment"
-)
-@pytest.mark.integration
-class TestTextExtractorWithRealLLM:
-    """Integration tests using real Google Gemini API for claim decomposition."""
-
-    @pytest.mark.asyncio
-    async def test_extract_pmc_ai_training_with_real_llm(self):
-        """
-        Integration test: Extract and decompose PMC AI training claim.
-
-        Tests extraction of a straightforward factual claim about:
-        - PMC initiating AI skill development training
-        - Timing: next week
-        - Location: SP College
-        """
-        extractor = TextExtractor()
-        claim_text = (
-            "The Indian Express reports that the Pune Municipal Corporation (PMC) has initiated "
-            "Artificial Intelligence (AI) skill development training for its senior officials "
-            "next week. It will be held at SP College."
-        )
-
-        try:
-            result = await extractor.extract(claim_text=claim_text, image_data=None)
-        except RuntimeError as e:
-            if "quota" in str(e).lower() or "rate" in str(e).lower():
-                pytest.skip(f"Rate limited: {e}")
-            raise
-
-        # Verify basic result structure
-        assert isinstance(result, ExtractedClaim)
-        assert result.claim_text == claim_text
-        assert result.extracted_from == "text"
-        assert 0 <= result.confidence <= 1
-
-        # Verify claim decomposition (who/what/when/where)
-        assert len(result.questions) > 0, "Should extract at least one claim element"
-
-        # Verify we have questions (should extract who, what, where, when)
-        question_types = {q.question_type for q in result.questions}
-        assert (
-            "who" in question_types or "what" in question_types
-        ), "Should extract who or what elements"
-
-        # Verify key assertions were extracted
-        assert (
-            len(result.segments) > 0
-        ), "Should extract key assertions from the claim"
-
-        # Verify confidence is reasonable (not fallback low score)
-        assert result.confidence > 0.4, "Should have decent confidence for clear claim"
-
-        print(f"\n✓ PMC AI Training Claim Extracted:")
-        print(f"  - Questions: {len(result.questions)}")
-        print(f"  - Assertions: {len(result.segments)}")
-        print(f"  - Confidence: {result.confidence:.2f}")
-        for q in result.questions:
-            print(f"    - {q.question_type}: {q.answer_text}")
-        for s in result.segments:
-            print(f"    - {s}")
-#        Output:
-#        ✓ PMC AI Training Claim Extracted:
-#          - Questions: 4
-#          - Assertions: 4
-#          - Confidence: 0.95
-#            - who: The Pune Municipal Corporation (PMC)
-#            - what: initiated Artificial Intelligence (AI) skill development training for its senior officials
-#            - when: next week
-#            - where: SP College
-#            - The Pune Municipal Corporation (PMC) has initiated AI skill development training.
-#            - The training is intended for PMC's senior officials.
-#            - The training will be held next week.
-#            - The training will take place at SP College.
-
-    @pytest.mark.asyncio
-    async def test_extract_affinity_fund_profit_claim_with_real_llm(self):
-        """
-        Integration test: Extract and decompose Affinity fund complex claim.
-
-        Tests extraction of a multi-part question/claim about:
-        - Affinity fund
-        - Control: Jared Kushner
-        - Specific profit amount: $5.7 billion
-        - Specific date: April 3
-        - Action: transfer outside country
-        """
-        extractor = TextExtractor()
-        claim_text = (
-            "Did the Affinity fund, controlled by Jared Kushner, make a "
-            "$5.7 billion profit on April 3 and transfer the profits outside "
-            "the country?"
-        )
-
-        try:
-            result = await extractor.extract(claim_text=claim_text, image_data=None)
-        except RuntimeError as e:
-            if "quota" in str(e).lower() or "rate" in str(e).lower():
-                pytest.skip(f"Rate limited: {e}")
-            raise
-
-        # Verify basic result structure
-        assert isinstance(result, ExtractedClaim)
-        assert result.claim_text == claim_text
-        assert result.extracted_from == "text"
-        assert 0 <= result.confidence <= 1
-
-        # Verify claim decomposition
-        assert len(result.questions) > 0, "Should extract claim elements from complex question"
-
-        # For a complex multi-part claim, should extract multiple elements
-        assert (
-            len(result.questions) >= 2
-        ), "Should extract multiple elements from multi-part claim"
-
-        # Verify question types (should have who, what, when, where)
-        question_types = {q.question_type for q in result.questions}
-        print(f"\n✓ Affinity Fund Claim Decomposed:")
-        print(f"  - Question types found: {sorted(question_types)}")
-        print(f"  - Total elements: {len(result.questions)}")
-        print(f"  - Assertions: {len(result.segments)}")
-        print(f"  - Confidence: {result.confidence:.2f}")
-
-        for q in result.questions:
-            print(f"    - {q.question_type}: {q.answer_text} (conf: {q.confidence:.2f})")
-        for s in result.segments:
-            print(f"    - {s}")
-
-        # Verify assertions were extracted
-        assert (
-            len(result.segments) > 0
-        ), "Should extract verifiable assertions from claim"
-
-#       # Output:
-#        ✓ Affinity Fund Claim Decomposed:
-#         - Question types found: ['what', 'when', 'where', 'who']
-#         - Total elements: 4
-#         - Assertions: 4
-#         - Confidence: 0.90
-#           - who: the Affinity fund, controlled by Jared Kushner (conf: 0.95)
-#           - what: make a $5.7 billion profit and transfer the profits outside the country (conf: 0.95)
-#           - when: April 3 (conf: 0.95)
-#           - where: outside the country (conf: 0.90)
-#           - The Affinity fund is controlled by Jared Kushner.
-#           - The Affinity fund made a $5.7 billion profit.
-#           - The profit was made on April 3.
-#           - The profits were transferred outside the country.
-#
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""Integration tests for TextExtractor against the real Gemini API.
+
+Deselected by default via ``-m "not integration"``; run with ``pytest -m integration``.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+
+import pytest
+
+from factchecker.core.models import ExtractedClaim
+from factchecker.extractors.text_extractor import TextExtractor
+
+# Check if API key is available for integration tests
+HAS_GEMINI_API_KEY = bool(os.getenv("GEMINI_API_KEY"))
+
+_log = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Record real LLM round-trips once, with credentials scrubbed."""
+    return {
+        "record_mode": "once",
+        "filter_headers": ["authorization", "x-goog-api-key"],
+        "filter_query_parameters": ["key"],
+    }
+
+
+def _assert_extracted(
+    result: ExtractedClaim | BaseException,
+    claim_text: str,
+    *,
+    min_q: int = 1,
+    min_conf: float = 0.0,
+) -> ExtractedClaim:
+    """Check one real-LLM extraction result, skipping the test when rate limited.
+
+    Args:
+        result: Value returned by ``asyncio.gather(..., return_exceptions=True)``
+        claim_text: The claim text that was submitted
+        min_q: Minimum number of extracted claim elements
+        min_conf: Confidence the result must exceed
+
+    Returns:
+        The validated ExtractedClaim
+    """
+    if isinstance(result, RuntimeError) and (
+        "quota" in str(result).lower() or "rate" in str(result).lower()
+    ):
+        pytest.skip(f"Rate limited: {result}")
+    if isinstance(result, BaseException):
+        raise result
+
+    assert isinstance(result, ExtractedClaim)
+    assert result.claim_text == claim_text
+    assert result.extracted_from == "text"
+    assert 0 <= result.confidence <= 1
+    assert (
+        len(result.questions) >= min_q
+    ), f"Should extract at least {min_q} claim element(s)"
+    assert len(result.segments) > 0, "Should extract key assertions from the claim"
+    assert result.confidence > min_conf
+    return result
+
+
+@pytest.mark.skipif(
+    not HAS_GEMINI_API_KEY, reason="GEMINI_API_KEY not set in environment"
+)
+@pytest.mark.integration
+@pytest.mark.vcr
+class TestTextExtractorWithRealLLM:
+    """Integration tests using real Google Gemini API for claim decomposition.
+
+    HTTP round-trips are recorded to ``cassettes/`` on the first run and
+    replayed afterwards, so warm runs make no Gemini API calls.
+    """
+
+    @pytest.fixture(autouse=True)
+    def rest_transport(self, monkeypatch):
+        """Route Gemini calls over REST; vcrpy cannot record the gRPC transport."""
+        import google.generativeai as genai
+
+        monkeypatch.setattr(
+            genai, "configure", functools.partial(genai.configure, transport="rest")
+        )
+
+    async def test_real_llm_claims_concurrent(self):
+        """
+        Integration test: Extract and decompose two independent claims concurrently.
+
+        The PMC AI training claim is a straightforward factual claim about:
+        - PMC initiating AI skill development training
+        - Timing: next week
+        - Location: SP College
+
+        The Affinity fund claim is a multi-part question/claim about:
+        - Affinity fund
+        - Control: Jared Kushner
+        - Specific profit amount: $5.7 billion
+        - Specific date: April 3
+        - Action: transfer outside country
+
+        Both LLM round-trips are issued together with asyncio.gather so the
+        test costs one round-trip of wall-clock time instead of two.
+        """
+        extractor = TextExtractor()
+        pmc_claim = (
+            "The Indian Express reports that the Pune Municipal Corporation (PMC) has initiated "
+            "Artificial Intelligence (AI) skill development training for its senior officials "
+            "next week. It will be held at SP College."
+        )
+        affinity_claim = (
+            "Did the Affinity fund, controlled by Jared Kushner, make a "
+            "$5.7 billion profit on April 3 and transfer the profits outside "
+            "the country?"
+        )
+
+        pmc_result, affinity_result = await asyncio.gather(
+            extractor.extract(claim_text=pmc_claim, image_data=None),
+            extractor.extract(claim_text=affinity_claim, image_data=None),
+            return_exceptions=True,
+        )
+
+        # Clear claim should not fall back to a low-confidence result
+        _assert_extracted(pmc_result, pmc_claim, min_conf=0.4)
+        question_types = {q.question_type for q in pmc_result.questions}
+        assert (
+            "who" in question_types or "what" in question_types
+        ), "Should extract who or what elements"
+
+        # Multi-part claim should decompose into several elements
+        _assert_extracted(affinity_result, affinity_claim, min_q=2)
+
+        # Enable with --log-cli-level=DEBUG when investigating extraction output
+        if _log.isEnabledFor(logging.DEBUG):
+            for label, result in (
+                ("PMC AI Training", pmc_result),
+                ("Affinity Fund", affinity_result),
+            ):
+                _log.debug(
+                    "%s claim: %d questions, %d assertions, confidence %.2f",
+                    label,
+                    len(result.questions),
+                    len(result.segments),
+                    result.confidence,
+                )
+                for q in result.questions:
+                    _log.debug(
+                        "  %s: %s (conf: %.2f)",
+                        q.question_type,
+                        q.answer_text,
+                        q.confidence,
+                    )
+                for segment in result.segments:
+                    _log.debug("  - %s", segment)
+
+#        Sample output from an earlier run:
+#        ✓ PMC AI Training Claim Extracted:
+#          - Questions: 4
+#          - Assertions: 4
+#          - Confidence: 0.95
+#            - who: The Pune Municipal Corporation (PMC)
+#            - what: initiated Artificial Intelligence (AI) skill development training for its senior officials
+#            - when: next week
+#            - where: SP College
+#            - The Pune Municipal Corporation (PMC) has initiated AI skill development training.
+#            - The training is intended for PMC's senior officials.
+#            - The training will be held next week.
+#            - The training will take place at SP College.
+#
+#        ✓ Affinity Fund Claim Decomposed:
+#         - Question types found: ['what', 'when', 'where', 'who']
+#         - Total elements: 4
+#         - Assertions: 4
+#         - Confidence: 0.90
+#           - who: the Affinity fund, controlled by Jared Kushner (conf: 0.95)
+#           - what: make a $5.7 billion profit and transfer the profits outside the country (conf: 0.95)
+#           - when: April 3 (conf: 0.95)
+#           - where: outside the country (conf: 0.90)
+#           - The Affinity fund is controlled by Jared Kushner.
+#           - The Affinity fund made a $5.7 billion profit.
+#           - The profit was made on April 3.
+#           - The profits were transferred outside the country.
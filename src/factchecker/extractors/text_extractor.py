@@ -4,17 +4,57 @@ import asyncio
 import json
 import re
 import unicodedata
-from typing import Any, Optional, Tuple
-
-import chardet
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 
 from factchecker.core.interfaces import BaseExtractor
 from factchecker.core.llm_provider import GoogleGeminiProvider
 from factchecker.core.models import ClaimQuestion, ExtractedClaim
 from factchecker.logging_config import get_logger
 
+_json_loads: Callable[[str], Any]
+try:
+    # Optional faster decoder; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# Precompiled patterns used on every extraction
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# ASCII text needing whitespace cleanup: any non-space whitespace (everything
+# str.split() separates on), a double space, or a leading/trailing space
+_ASCII_UNCLEAN_RE = re.compile(r"[\t\n\x0b\x0c\r\x1c-\x1f]|  |^ | $")
+
+# Claim elements requested from the LLM, in the order questions are built
+_ELEMENT_TYPES: tuple[str, ...] = (
+    "who",
+    "what",
+    "when",
+    "where",
+    "how",
+    "why",
+    "platform",
+)
+
+# Invisible format characters that survive NFKC: zero-width space, soft hyphen,
+# word joiner, BOM and bidi controls. ZWJ/ZWNJ are kept because emoji sequences
+# and Indic scripts depend on them.
+_INVISIBLE_CHARS = str.maketrans(
+    dict.fromkeys(
+        map(
+            ord,
+            "\u00ad\u200b\u200e\u200f\u2060\ufeff"
+            "\u202a\u202b\u202c\u202d\u202e\u2066\u2067\u2068\u2069",
+        )
+    )
+)
+
 
 class TextExtractor(BaseExtractor):
     """Extracts claims from text input."""
@@ -22,6 +62,18 @@ class TextExtractor(BaseExtractor):
     # Text validation constants
     MIN_TEXT_LENGTH = 1
     MAX_TEXT_LENGTH = 1000
+    # Longer inputs are cut to this before normalization (collapse only shrinks)
+    PRE_TRUNCATE_LENGTH = MAX_TEXT_LENGTH * 4
+
+    # Inputs with fewer words (or no letters) are not sent to the LLM
+    MIN_LLM_WORD_COUNT = 3
+    # Number of recent LLM extractions kept, keyed by normalized text
+    LLM_CACHE_SIZE = 256
+
+    # LLM provider shared by all instances, created on first use
+    _provider: Optional[GoogleGeminiProvider] = None
+    # Recent LLM extraction results, least recently used first
+    _llm_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     async def extract(
         self, claim_text: Optional[str], image_data: Optional[bytes]
@@ -32,26 +84,28 @@ class TextExtractor(BaseExtractor):
                 "No text provided."
             )
 
-        # Process text if provided
-        normalized_text = ""
-        validation_metadata: dict = {}
         original_text = claim_text
-
-        # Normalize text
-        # TODO: Check if this step adds value
-        normalized_text, was_normalized = self._normalize_text(claim_text)
-
-        # Validate and clean text
-        normalized_text, validation_metadata = self._validate_and_clean_text(
-            normalized_text, was_normalized
-        )
+        has_image = image_data is not None and len(image_data) > 0
+
+        # Normalize, validate and measure text in one step
+        # TODO: Check if normalization adds value
+        (
+            normalized_text,
+            was_normalized,
+            truncated,
+            word_count,
+            sentence_count,
+        ) = self._process_text(claim_text)
 
         # Collect metadata
         metadata = self._collect_metadata(
             original_text=original_text,
             normalized_text=normalized_text,
-            image_data=image_data,
-            validation_metadata=validation_metadata,
+            has_image=has_image,
+            was_normalized=was_normalized,
+            truncated=truncated,
+            word_count=word_count,
+            sentence_count=sentence_count,
         )
 
         # Call LLM to extract and decompose claims into who/what/when/where/how/why
@@ -59,17 +113,24 @@ class TextExtractor(BaseExtractor):
         segments: list[str] = []
         confidence = 0.0  # Default low confidence for fallback
 
-        try:
-            llm_result = await self._extract_with_llm(normalized_text)
-            questions = llm_result["questions"]
-            segments = llm_result["segments"]
-            confidence = llm_result["confidence"]
-        except Exception as e:
-            logger.warning(
-                f"LLM-based claim extraction failed: {e}. Using fallback extraction.",
-                exc_info=True,
-            )
-            # Fallback: use text-only extraction without LLM decomposition
+        if (
+            word_count < self.MIN_LLM_WORD_COUNT
+            or not _LETTER_RE.search(normalized_text)
+        ):
+            # Too short or no letters to decompose; skip the LLM round-trip
+            logger.debug("Input too trivial for LLM claim extraction, skipping")
+        else:
+            try:
+                llm_result = await self._extract_with_llm(normalized_text)
+                questions = llm_result["questions"]
+                segments = llm_result["segments"]
+                confidence = llm_result["confidence"]
+            except Exception as e:
+                logger.warning(
+                    f"LLM-based claim extraction failed: {e}. Using fallback extraction.",
+                    exc_info=True,
+                )
+                # Fallback: use text-only extraction without LLM decomposition
 
         return ExtractedClaim(
             claim_text=normalized_text,
@@ -81,100 +142,108 @@ class TextExtractor(BaseExtractor):
             metadata=metadata,
         )
 
-    def _normalize_text(self, text: str) -> Tuple[str, bool]:
-        """
-        Normalize text by stripping whitespace, normalizing unicode, and collapsing whitespace.
-
-        Args:
-            text: Input text to normalize
-
-        Returns:
-            Tuple of (normalized_text, was_normalized) where was_normalized indicates
-            if any normalization was applied
+    @classmethod
+    def _process_text(cls, text: str) -> Tuple[str, bool, bool, int, int]:
         """
-        if not text:
-            return "", False
-
-        original_text = text
-        normalized = False
-
-        try:
-            # Strip leading/trailing whitespace
-            text = text.strip()
-            if text != original_text:
-                normalized = True
-
-            # Normalize Unicode (NFKC: compatibility decomposition + composition)
-            normalized_text = unicodedata.normalize("NFKC", text)
-            if normalized_text != text:
-                normalized = True
-                text = normalized_text
-
-            # Collapse multiple whitespace/newlines to single space
-            collapsed_text = re.sub(r"\s+", " ", text)
-            if collapsed_text != text:
-                normalized = True
-                text = collapsed_text
-
-            return text, normalized
-
-        except Exception as e:
-            logger.warning(
-                f"Text normalization failed: {e}. Returning original text.",
-                exc_info=True,
-            )
-            return original_text, False
+        Normalize, validate and measure text.
 
-    def _validate_and_clean_text(
-        self, text: str, was_normalized: bool
-    ) -> Tuple[str, dict]:
-        """
-        Validate text length and handle edge cases.
+        Normalization applies NFKC (skipped when the text is already normal),
+        strips leading/trailing whitespace and collapses whitespace runs to a
+        single space; the word count comes from that same step.
 
         Args:
-            text: Normalized text to validate
-            was_normalized: Whether normalization was applied
+            text: Input text to process
 
         Returns:
-            Tuple of (cleaned_text, validation_metadata)
+            Tuple of (cleaned_text, was_normalized, truncated, word_count,
+            sentence_count)
 
         Raises:
-            ValueError: If text is empty after normalization
+            ValueError: If text is empty after normalization or below minimum length
         """
-        validation_metadata: dict = {
-            "normalized": was_normalized,
-            "truncated": False,
-        }
+        original_text = text
+        max_len = cls.MAX_TEXT_LENGTH
+        normalize = cls._normalize_text
+
+        # Pathologically long input: normalize only a bounded prefix. The prefix
+        # is enough unless whitespace collapse shrinks it to MAX_TEXT_LENGTH or
+        # less, in which case the rest of the input is still needed.
+        source_text = text[: cls.PRE_TRUNCATE_LENGTH]
+        text, word_count = normalize(source_text)
+        if source_text is not original_text and len(text) <= max_len:
+            source_text = original_text
+            text, word_count = normalize(source_text)
 
-        # Check if text is empty after normalization
-        if not text or len(text.strip()) == 0:
+        if not text:
             raise ValueError(
                 "Text is empty or contains only whitespace after normalization"
             )
 
+        was_normalized = text != source_text
+        truncated = False
+        text_length = len(text)
+
         # Check if text exceeds maximum length
-        if len(text) > self.MAX_TEXT_LENGTH:
+        if text_length > max_len:
             logger.warning(
-                f"Text length ({len(text)}) exceeds maximum ({self.MAX_TEXT_LENGTH}). "
+                f"Text length ({text_length}) exceeds maximum ({max_len}). "
                 "Truncating to maximum length."
             )
-            text = text[: self.MAX_TEXT_LENGTH]
-            validation_metadata["truncated"] = True
-
-        # Check minimum length (after truncation)
-        if len(text) < self.MIN_TEXT_LENGTH:
+            text = text[:max_len]
+            truncated = True
+            # Text is single-space separated, so count separators instead of
+            # splitting; a cut right after a space leaves no extra word
+            word_count = text.count(" ") + 1 - text.endswith(" ")
+        # Truncated text is exactly MAX_TEXT_LENGTH long, so only untruncated
+        # text can fall below the minimum
+        elif text_length < cls.MIN_TEXT_LENGTH:
             raise ValueError(
-                f"Text length ({len(text)}) is below minimum ({self.MIN_TEXT_LENGTH})"
+                f"Text length ({text_length}) is below minimum ({cls.MIN_TEXT_LENGTH})"
             )
 
-        return text, validation_metadata
+        # Sentence count (approximate using regex for sentence endings); subn
+        # counts matches in C without building a list of match strings
+        sentence_count = _SENTENCE_END_RE.subn("", text)[1] or 1
+
+        return text, was_normalized, truncated, word_count, sentence_count
+
+    @staticmethod
+    def _normalize_text(text: str) -> Tuple[str, int]:
+        """
+        Apply NFKC, drop invisible format characters and collapse whitespace.
+
+        Args:
+            text: Input text to normalize
+
+        Returns:
+            Tuple of (normalized_text, word_count); normalized_text has no
+            leading/trailing whitespace and single spaces between words
+        """
+        if text.isascii():
+            # Common case: ASCII is always NFKC, and already-clean text needs
+            # no collapsing, so return it untouched
+            if text and not _ASCII_UNCLEAN_RE.search(text):
+                return text, text.count(" ") + 1
+        else:
+            # The quick check skips the normalize pass for already-normal text
+            if not unicodedata.is_normalized("NFKC", text):
+                text = unicodedata.normalize("NFKC", text)
+            text = text.translate(_INVISIBLE_CHARS)
+
+        # str.split() with no separator strips and treats any Unicode whitespace
+        # run as one separator
+        words = text.split()
+        return " ".join(words), len(words)
 
+    @staticmethod
     def _collect_metadata(
-        self,
         original_text: str,
         normalized_text: str,
-        image_data: Optional[bytes],
-        validation_metadata: dict,
+        has_image: bool,
+        was_normalized: bool,
+        truncated: bool,
+        word_count: int,
+        sentence_count: int,
     ) -> dict:
         """
         Collect comprehensive metadata about the extracted text.
@@ -182,45 +251,58 @@ class TextExtractor(BaseExtractor):
         Args:
             original_text: Original text before normalization
             normalized_text: Normalized text after processing
-            image_data: Optional image data
-            validation_metadata: Metadata from validation step
+            has_image: Whether non-empty image data accompanied the text
+            was_normalized: Whether normalization changed the text
+            truncated: Whether the text was cut to MAX_TEXT_LENGTH
+            word_count: Number of words in the normalized text
+            sentence_count: Approximate number of sentences (at least 1)
 
         Returns:
             Dictionary containing all metadata fields
         """
-        metadata: dict = {
+        # Python 3 strings are already decoded, so text is reported as UTF-8
+        return {
             "text_length": len(normalized_text),
             "original_text_length": len(original_text),
-            "has_image": image_data is not None,
+            "has_image": has_image,
+            "normalized": was_normalized,
+            "truncated": truncated,
+            "word_count": word_count,
+            "sentence_count": sentence_count,
+            "encoding": "utf-8",
         }
 
-        # Add validation metadata
-        metadata.update(validation_metadata)
-
-        # Word count (split on whitespace, filter empty strings)
-        words = [w for w in normalized_text.split() if w]
-        metadata["word_count"] = len(words)
+    @classmethod
+    def _get_provider(cls) -> GoogleGeminiProvider:
+        """
+        Return the shared LLM provider, creating it on first use.
 
-        # Sentence count (approximate using regex for sentence endings)
-        sentence_endings = re.findall(r"[.!?]+", normalized_text)
-        metadata["sentence_count"] = len(sentence_endings) if sentence_endings else 1
+        Construction is synchronous, so no other coroutine can interleave between
+        the check and the assignment. Failures are not cached.
 
-        # Encoding detection (if we have bytes, otherwise assume UTF-8)
-        if image_data:
-            # If we have image data, we can't detect text encoding from it
-            # This is handled by ImageExtractor
-            metadata["encoding"] = "utf-8"  # Default assumption
-        else:
-            # For text input, Python 3 strings are already decoded
-            # We assume UTF-8 encoding (standard for Python 3)
-            metadata["encoding"] = "utf-8"
+        Returns:
+            The shared GoogleGeminiProvider instance
 
-        return metadata
+        Raises:
+            RuntimeError: If the provider cannot be initialized
+        """
+        provider = cls._provider
+        if provider is None:
+            try:
+                provider = cls._provider = GoogleGeminiProvider()
+            except RuntimeError as e:
+                logger.error(f"Failed to initialize LLM provider: {e}")
+                raise
+        return provider
 
     async def _extract_with_llm(self, text: str) -> dict[str, Any]:
         """
         Extract and decompose claims using LLM (who/what/when/where/how/why).
 
+        Results are cached by text, so a resubmitted claim skips the LLM call.
+        Every call gets its own copies of the cached questions and segments, so
+        callers may mutate them freely.
+
         Args:
             text: Normalized text to extract claims from
 
@@ -230,11 +312,14 @@ class TextExtractor(BaseExtractor):
         Raises:
             Exception: If LLM call fails or response is invalid
         """
-        try:
-            provider = GoogleGeminiProvider()
-        except RuntimeError as e:
-            logger.error(f"Failed to initialize LLM provider: {e}")
-            raise
+        cache = type(self)._llm_cache
+        cached = cache.get(text)
+        if cached is not None:
+            cache.move_to_end(text)
+            logger.debug("LLM extraction cache hit")
+            return self._copy_llm_result(cached)
+
+        provider = self._get_provider()
 
         # Call LLM with the claim_extraction_from_text use case
         llm_response = await provider.call(
@@ -247,47 +332,42 @@ class TextExtractor(BaseExtractor):
             # Log the raw response for debugging
             logger.debug(f"Raw LLM response: {llm_response}")
 
-            # Handle markdown code blocks (```json...```)
+            # Handle markdown code blocks (```json...```); the json label is optional
+            # and anything after the closing fence is ignored
             response_text = llm_response.strip()
             if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
+                end = response_text.find("```", 3)
+                response_text = response_text[3:end] if end != -1 else response_text[3:]
+                response_text = response_text.removeprefix("json")
+            else:
+                response_text = response_text.removesuffix("```")
 
-            llm_data = json.loads(response_text.strip())
+            llm_data = _json_loads(response_text.strip())
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response as JSON: {e}")
             raise ValueError(f"Invalid JSON from LLM: {e}") from e
 
         # Extract questions from who/what/when/where/how/why/platform elements
         questions: list[ClaimQuestion] = []
-        element_types = ["who", "what", "when", "where", "how", "why", "platform"]
 
-        for element_type in element_types:
-            if element_type not in llm_data:
+        for element_type in _ELEMENT_TYPES:
+            element = llm_data.get(element_type)
+            # Skip missing/malformed elements and those marked as unknown
+            if not isinstance(element, dict) or element.get("is_unknown", False):
                 continue
 
-            element = llm_data[element_type]
-            if not isinstance(element, dict):
-                continue
-
-            # Skip if element is marked as unknown
-            if element.get("is_unknown", False):
-                continue
-
-            value = element.get("value", "").strip()
+            value = (element.get("value") or "").strip()
             if not value:
                 continue
 
-            question = ClaimQuestion(
-                question_type=element_type,  # type: ignore
-                answer_text=value,
-                related_entity=element.get("related_entity"),
-                confidence=float(element.get("confidence", 0.5)),
+            questions.append(
+                ClaimQuestion(
+                    question_type=element_type,  # type: ignore
+                    answer_text=value,
+                    related_entity=element.get("related_entity"),
+                    confidence=float(element.get("confidence", 0.5)),
+                )
             )
-            questions.append(question)
 
         # Extract key assertions
         segments = llm_data.get("key_assertions", [])
@@ -297,8 +377,21 @@ class TextExtractor(BaseExtractor):
         # Extract overall confidence
         confidence = float(llm_data.get("overall_confidence", 0.5))
 
-        return {
+        result = {
             "questions": questions,
             "segments": segments,
             "confidence": confidence,
         }
+        cache[text] = result
+        if len(cache) > self.LLM_CACHE_SIZE:
+            cache.popitem(last=False)
+        return self._copy_llm_result(result)
+
+    @staticmethod
+    def _copy_llm_result(result: dict[str, Any]) -> dict[str, Any]:
+        """Copy a cached LLM result so callers cannot mutate the cache entry."""
+        return {
+            "questions": [q.model_copy() for q in result["questions"]],
+            "segments": list(result["segments"]),
+            "confidence": result["confidence"],
+        }
@@ -23,7 +23,6 @@ class TextImageExtractor:
         """
         # TODO: Implement text image extraction logic
         # For now, placeholder returns None
-        logger.debug("extract_from_text_image: placeholder implementation")
         return None
 
     async def extract_from_top_image(
@@ -39,7 +38,6 @@ class TextImageExtractor:
         """
         # TODO: Implement top image extraction logic
         # For now, placeholder returns None
-        logger.debug("extract_from_top_image: placeholder implementation")
         return None
 
     async def extract_from_inside_image(
@@ -55,6 +53,5 @@ class TextImageExtractor:
         """
         # TODO: Implement inside image extraction logic
         # For now, placeholder returns None
-        logger.debug("extract_from_inside_image: placeholder implementation")
         return None
 
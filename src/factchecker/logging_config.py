@@ -3,10 +3,11 @@
 import logging
 import asyncio
 import contextvars
+import re
+import time
 import traceback
-from functools import wraps
-from typing import Callable, Any
-from datetime import datetime
+from functools import cache, wraps
+from typing import Any, Callable, Optional
 
 # Context variable for request tracing
 request_id_var: contextvars.ContextVar = contextvars.ContextVar(
@@ -18,13 +19,23 @@ error_context_var: contextvars.ContextVar = contextvars.ContextVar(
     "error_context", default=None
 )
 
+# Context variable collecting per-stage elapsed times (ms) for one request
+stage_timings_var: contextvars.ContextVar[Optional[dict[str, float]]] = (
+    contextvars.ContextVar("stage_timings", default=None)
+)
+
 
 class RequestIdFilter(logging.Filter):
     """Filter to inject request_id context variable into log records."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        """Add request_id to the log record."""
-        record.request_id = request_id_var.get()
+        """Add request_id to the log record.
+
+        Records logged through RequestIdLoggerAdapter already carry the
+        request_id, so the context variable is only read for the others.
+        """
+        if "request_id" not in record.__dict__:
+            record.request_id = request_id_var.get()
         return True
 
 
@@ -44,8 +55,10 @@ class RequestIdLoggerAdapter(logging.LoggerAdapter):
 def setup_logging(level=logging.INFO) -> logging.Logger:
     """Initialize logging with structured format."""
     handler = logging.StreamHandler()
+    # %(created) is the record's epoch float; unlike %(asctime) it needs no
+    # localtime/strftime call per record
     formatter = logging.Formatter(
-        "%(asctime)s | %(name)s | %(levelname)s | %(request_id)s | %(message)s"
+        "%(created).3f | %(name)s | %(levelname)s | %(request_id)s | %(message)s"
     )
     handler.setFormatter(formatter)
 
@@ -59,8 +72,13 @@ def setup_logging(level=logging.INFO) -> logging.Logger:
     return logger
 
 
+@cache
 def get_logger(name: str) -> logging.LoggerAdapter:
-    """Get logger with automatic request_id injection."""
+    """Get logger with automatic request_id injection.
+
+    Adapters are cached per name; they hold no per-call state, so every caller
+    can share the same one.
+    """
     logger = logging.getLogger(f"factchecker.{name}")
     
     # Ensure the logger has the request_id filter
@@ -71,10 +89,16 @@ def get_logger(name: str) -> logging.LoggerAdapter:
     return RequestIdLoggerAdapter(logger, {})
 
 
+# Innermost stack frames kept in error traceback summaries
+TRACEBACK_SUMMARY_FRAMES = 4
+
+# Field-name fragments that mark a value as sensitive, matched in one scan
+_SENSITIVE_RE = re.compile("password|token|secret|image_data|api_key")
+
+
 def _is_sensitive(key: str) -> bool:
     """Check if field name suggests sensitive data."""
-    sensitive_keywords = ["password", "token", "secret", "image_data", "api_key"]
-    return any(keyword in key.lower() for keyword in sensitive_keywords)
+    return _SENSITIVE_RE.search(key.lower()) is not None
 
 
 def _sanitize_value(value: Any) -> Any:
@@ -116,76 +140,109 @@ def _extract_params(args: tuple, kwargs: dict) -> dict:
 
 def _extract_traceback_summary(exception: Exception) -> str:
     """Extract condensed traceback showing call chain."""
+    # Format only the innermost frames (most relevant) instead of slicing
+    # the tail off a fully formatted traceback
     tb_lines = traceback.format_exception(
-        type(exception), exception, exception.__traceback__
+        type(exception),
+        exception,
+        exception.__traceback__,
+        limit=-TRACEBACK_SUMMARY_FRAMES,
+        chain=False,
     )
-    # Return last 5 lines (most relevant)
-    return "".join(tb_lines[-5:])
+    return "".join(tb_lines)
 
 
 def log_stage(stage_name: str):
-    """Decorator to log stage execution with timing."""
+    """Decorator to log stage execution with timing.
+
+    Start and completion are logged at DEBUG; at INFO a request is summarized
+    by the elapsed times collected into stage_timings_var.
+    """
 
     def decorator(func: Callable) -> Callable:
         logger = get_logger(func.__module__)
 
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = datetime.now()
-            logger.info(f"Stage '{stage_name}' started")
-            try:
-                result = await func(*args, **kwargs)
-                elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
-                logger.info(
-                    f"Stage '{stage_name}' completed (elapsed: {elapsed_ms:.2f}ms)"
-                )
-                return result
-            except Exception as e:
-                elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
-                logger.error(
-                    f"Stage '{stage_name}' failed: {str(e)} (elapsed: {elapsed_ms:.2f}ms)",
-                    exc_info=True,
-                )
-                # Import here to avoid circular imports
-                from factchecker.pipeline.factcheck_pipeline import (
-                    PipelineExecutionError,
-                )
-
-                # Wrap the exception with context
-                wrapped_error = PipelineExecutionError(
-                    message=str(e),
-                    stage_name=stage_name,
-                    function_name=func.__qualname__,
-                    input_params=_extract_params(args, kwargs),
-                    original_exception=e,
-                )
-                # Store error context
-                error_context_var.set(
-                    {
-                        "stage": stage_name,
-                        "function": func.__qualname__,
-                        "error": wrapped_error,
-                    }
-                )
-                raise wrapped_error
+        # Pick the wrapper once, at decoration time
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_ns = time.perf_counter_ns()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Stage '%s' started", stage_name)
+                try:
+                    result = await func(*args, **kwargs)
+                    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                    stage_timings = stage_timings_var.get()
+                    if stage_timings is not None:
+                        stage_timings[stage_name] = round(elapsed_ms, 2)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Stage '%s' completed (elapsed: %.2fms)",
+                            stage_name,
+                            elapsed_ms,
+                        )
+                    return result
+                except Exception as e:
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error(
+                            "Stage '%s' failed: %s (elapsed: %.2fms)",
+                            stage_name,
+                            e,
+                            (time.perf_counter_ns() - start_ns) / 1_000_000,
+                            exc_info=True,
+                        )
+                    # Import here to avoid circular imports
+                    from factchecker.pipeline.factcheck_pipeline import (
+                        PipelineExecutionError,
+                    )
+
+                    # Wrap the exception with context
+                    wrapped_error = PipelineExecutionError(
+                        message=str(e),
+                        stage_name=stage_name,
+                        function_name=func.__qualname__,
+                        input_params=_extract_params(args, kwargs),
+                        original_exception=e,
+                    )
+                    # Store error context
+                    error_context_var.set(
+                        {
+                            "stage": stage_name,
+                            "function": func.__qualname__,
+                            "error": wrapped_error,
+                        }
+                    )
+                    raise wrapped_error
+
+            return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = datetime.now()
-            logger.info(f"Stage '{stage_name}' started")
+            start_ns = time.perf_counter_ns()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stage '%s' started", stage_name)
             try:
                 result = func(*args, **kwargs)
-                elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
-                logger.info(
-                    f"Stage '{stage_name}' completed (elapsed: {elapsed_ms:.2f}ms)"
-                )
+                elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                stage_timings = stage_timings_var.get()
+                if stage_timings is not None:
+                    stage_timings[stage_name] = round(elapsed_ms, 2)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Stage '%s' completed (elapsed: %.2fms)",
+                        stage_name,
+                        elapsed_ms,
+                    )
                 return result
             except Exception as e:
-                elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
-                logger.error(
-                    f"Stage '{stage_name}' failed: {str(e)} (elapsed: {elapsed_ms:.2f}ms)",
-                    exc_info=True,
-                )
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "Stage '%s' failed: %s (elapsed: %.2fms)",
+                        stage_name,
+                        e,
+                        (time.perf_counter_ns() - start_ns) / 1_000_000,
+                        exc_info=True,
+                    )
                 # Import here to avoid circular imports
                 from factchecker.pipeline.factcheck_pipeline import (
                     PipelineExecutionError,
@@ -209,10 +266,6 @@ def log_stage(stage_name: str):
                 )
                 raise wrapped_error
 
-        return (
-            async_wrapper
-            if asyncio.iscoroutinefunction(func)
-            else sync_wrapper
-        )
+        return sync_wrapper
 
     return decorator
@@ -1,10 +1,16 @@
 """Main fact-checking pipeline orchestrator."""
 
 import asyncio
+import hashlib
+import logging
+import os
+import time
 import uuid
 import traceback
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Mapping, Optional, List, Tuple, Union
 
 from factchecker.core.models import (
     FactCheckRequest,
@@ -28,10 +34,50 @@ from factchecker.logging_config import (
     log_stage,
     request_id_var,
     error_context_var,
+    stage_timings_var,
+    TRACEBACK_SUMMARY_FRAMES,
 )
 
 logger = get_logger(__name__)
 
+# Default source order from configured sequence numbers, computed once since
+# EXTERNAL_SOURCES is static. Sources with negative sequence values are
+# disabled and left out.
+_DEFAULT_SOURCE_ORDER: Tuple[str, ...] = tuple(
+    sorted(
+        (key for key, config in EXTERNAL_SOURCES.items() if config.sequence >= 0),
+        key=lambda key: EXTERNAL_SOURCES[key].sequence,
+    )
+)
+
+# Constant part of the mock FactCheckResponse built by _generate_response.
+# Validated once here; per-request fields are filled in with model_copy.
+_MOCK_RESPONSE_TEMPLATE = FactCheckResponse(
+    request_id="",
+    claim_id="",
+    verdict=VerdictEnum.MIXED,
+    confidence=0.75,
+    references=[
+        Reference(
+            title="Mock Source",
+            url="https://mock.source/article",
+            snippet="This is a mock reference snippet",
+            external_source="news",
+        )
+    ],
+    explanation="Mock explanation: This claim contains both accurate and inaccurate elements.",
+    search_queries_used=["mock query 1", "mock query 2"],
+    cached=False,
+    processing_time_ms=0.0,
+    timestamp=datetime.min,
+)
+
+# Question types boosted to full confidence when a source matches a claim
+_CORE_QUESTION_TYPES = frozenset(("who", "what", "where"))
+
+# Source keys by lowercase name, for matching 'where' answers
+_PLATFORM_BY_LOWER: dict[str, str] = {key.lower(): key for key in EXTERNAL_SOURCES}
+
 
 class PipelineExecutionError(Exception):
     """Exception with pipeline execution context."""
@@ -55,6 +101,20 @@ class PipelineExecutionError(Exception):
 class FactCheckPipeline(IPipeline):
     """Orchestrates fact-checking pipeline stages."""
 
+    # Maximum number of claims searched concurrently per request
+    CLAIM_CONCURRENCY_LIMIT = 32
+    # Maximum in-flight searches per platform, on top of the overall limit
+    # set by FC_MAX_CONCURRENT_SEARCHES
+    PLATFORM_SEARCH_LIMIT = 16
+    # Used when FC_MAX_CONCURRENT_SEARCHES is unset or invalid
+    DEFAULT_MAX_CONCURRENT_SEARCHES = 64
+    # In-process LRU kept in front of the shared cache
+    LOCAL_CACHE_SIZE = 1024
+    LOCAL_CACHE_TTL_SECONDS = 3600
+    # Images already found to contain no text, skipped on re-upload
+    NON_TEXT_IMAGE_CACHE_SIZE = 1024
+    NON_TEXT_IMAGE_TTL_SECONDS = 3600
+
     def __init__(self, cache, extractors, searchers, processors):
         self.cache = cache
         self.searchers = searchers
@@ -62,76 +122,230 @@ class FactCheckPipeline(IPipeline):
         # Extractors dict should contain "text", "image", "image_handler", and "text_image_extractor"
         self.text_extractor: TextExtractor = extractors.get("text")
         self.image_extractor: ImageExtractor = extractors.get("image")
-        self.image_handler: ImageHandler = extractors.get("image_handler", ImageHandler())
-        self.text_image_extractor: TextImageExtractor = extractors.get(
-            "text_image_extractor", TextImageExtractor()
+        # Defaults are only constructed when the caller did not supply one
+        image_handler = extractors.get("image_handler")
+        self.image_handler: ImageHandler = (
+            image_handler if image_handler is not None else ImageHandler()
+        )
+        text_image_extractor = extractors.get("text_image_extractor")
+        self.text_image_extractor: TextImageExtractor = (
+            text_image_extractor
+            if text_image_extractor is not None
+            else TextImageExtractor()
         )
+        # Bounds outbound searches across all requests on this pipeline
+        self._search_sem = asyncio.Semaphore(self._max_concurrent_searches())
+        self._platform_sems: dict[str, asyncio.Semaphore] = {}
+        # Background cache writes, held so they are not garbage collected
+        self._pending_writes: set[asyncio.Task[None]] = set()
+        # Cache key -> (monotonic expiry, response), least recently used first
+        self._local_cache: OrderedDict[str, Tuple[float, FactCheckResponse]] = (
+            OrderedDict()
+        )
+        # Image digest -> monotonic expiry, least recently used first
+        self._non_text_images: OrderedDict[bytes, float] = OrderedDict()
+
+    @classmethod
+    def _max_concurrent_searches(cls) -> int:
+        """Read FC_MAX_CONCURRENT_SEARCHES, falling back to the default.
+
+        A non-numeric or non-positive value would fail construction or stall
+        every search, so it is logged and replaced by the default.
+        """
+        raw = os.getenv("FC_MAX_CONCURRENT_SEARCHES")
+        if raw is None:
+            return cls.DEFAULT_MAX_CONCURRENT_SEARCHES
+        try:
+            limit = int(raw)
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            logger.warning(
+                "Invalid FC_MAX_CONCURRENT_SEARCHES %r; using %d",
+                raw,
+                cls.DEFAULT_MAX_CONCURRENT_SEARCHES,
+            )
+            return cls.DEFAULT_MAX_CONCURRENT_SEARCHES
+        return limit
 
     async def check_claim(self, request: FactCheckRequest) -> FactCheckResponse:
         """Execute full fact-checking pipeline."""
 
-        # Generate request ID for tracing
+        # Generate request ID for tracing; later stages rely on it being set
         request.request_id = request.request_id or str(uuid.uuid4())
         request_id_var.set(request.request_id)
-
-        start_time = datetime.now()
-        logger.info(
-            "Fact-check request started",
-            extra={"user_id": request.user_id, "source": request.source_platform},
-        )
+        # Filled in by @log_stage; reported once when the request finishes
+        stage_timings: dict[str, float] = {}
+        stage_timings_var.set(stage_timings)
+
+        # Monotonic start mark; processing_time_ms is measured from here
+        start_ns = time.perf_counter_ns()
+        # Gated so the extra dicts are not built when INFO is filtered out
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            logger.info(
+                "Fact-check request started",
+                extra={"user_id": request.user_id, "source": request.source_platform},
+            )
 
         try:
+            # Stages 1 and 2 do not depend on each other: claim extraction is
+            # started speculatively while the cache lookup runs
+            extract_task = asyncio.create_task(self._extract_claims(request))
+
             # Stage 1: Cache lookup
-            cached = await self._check_cache(request)
+            try:
+                cached = await self._check_cache(request)
+            except BaseException:
+                await self._cancel_task(extract_task)
+                raise
             if cached:
+                await self._cancel_task(extract_task)
                 logger.info("Cache hit - returning cached response")
-                cached.cached = True
-                cached.processing_time_ms = (
-                    datetime.now() - start_time
-                ).total_seconds() * 1000
-                return cached
+                # Cache entries are shared; each hit gets its own copy
+                return cached.model_copy(
+                    deep=True,
+                    update={
+                        "request_id": request.request_id,
+                        "cached": True,
+                        "processing_time_ms": (
+                            time.perf_counter_ns() - start_ns
+                        ) / 1_000_000,
+                    },
+                )
 
             # Stage 2: Extract claims
-            extracted_claims = await self._extract_claims(request)
+            extracted_claims = await extract_task
 
             # Stage 3: Search external sources
             all_results = await self._verify_claims(extracted_claims)
 
             # Stage 4: Process results
             response = await self._generate_response(
-                request, extracted_claims, all_results, start_time
+                request, extracted_claims, all_results, start_ns
             )
 
-            # Stage 5: Cache response
-            await self._cache_response(response)
-
-            logger.info("Fact-check request completed successfully")
+            # Stage 5: Cache response, off the critical path; aclose() waits
+            # for writes still in flight
+            write_task = asyncio.create_task(self._cache_response(request, response))
+            self._pending_writes.add(write_task)
+            write_task.add_done_callback(self._on_cache_write_done)
+
+            # "Cache Storage" finishes in the background after this record,
+            # so its time is absent from the summary
+            if info_enabled:
+                logger.info(
+                    "Fact-check request completed successfully",
+                    extra={"stage_timings_ms": stage_timings},
+                )
             return response
 
         except PipelineExecutionError as e:
             logger.error(
-                f"Pipeline failed at stage '{e.stage_name}': {str(e)}", exc_info=True
+                "Pipeline failed at stage '%s': %s", e.stage_name, e, exc_info=True
             )
-            error_response = await self._generate_error_response(
-                request, e, start_time
+            error_response = self._generate_error_response(
+                request, e, start_ns
             )
             logger.info("Fact-check request completed with error response")
             return error_response
         except Exception as e:
             logger.error(
-                f"Pipeline encountered unexpected error: {str(e)}", exc_info=True
+                "Pipeline encountered unexpected error: %s", e, exc_info=True
             )
-            error_response = await self._generate_error_response(
-                request, e, start_time
+            error_response = self._generate_error_response(
+                request, e, start_ns
             )
             logger.info("Fact-check request completed with error response")
             return error_response
 
+    async def aclose(self) -> None:
+        """Wait for background cache writes to finish (graceful shutdown)."""
+        await asyncio.gather(*self._pending_writes, return_exceptions=True)
+
+    def _on_cache_write_done(self, task: asyncio.Task[None]) -> None:
+        """Forget a finished cache write, consuming any exception it raised.
+
+        Failures are already logged by the "Cache Storage" stage.
+        """
+        self._pending_writes.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    async def _cancel_task(task: asyncio.Task[Any]) -> None:
+        """Cancel a speculative stage task and wait for it to unwind."""
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
     @log_stage("Cache Lookup")
     async def _check_cache(self, request: FactCheckRequest) -> Optional[FactCheckResponse]:
-        """Check if claim result is cached."""
-        cache_key = request.claim_text or ""
-        return await self.cache.get(cache_key)
+        """Check if claim result is cached.
+
+        The in-process LRU is consulted first; a miss there falls through to
+        the shared cache, and a hit from it is kept locally for next time.
+        The returned entry is shared by every hit and must not be mutated.
+        """
+        cache_key = self._cache_key(request)
+
+        entry = self._local_cache.get(cache_key)
+        if entry is not None:
+            expires_at, response = entry
+            if time.monotonic() < expires_at:
+                self._local_cache.move_to_end(cache_key)
+                return response
+            del self._local_cache[cache_key]
+
+        response = await self.cache.get(cache_key)
+        if response is not None:
+            self._store_local(cache_key, response)
+        return response
+
+    @staticmethod
+    def _cache_key(request: FactCheckRequest) -> str:
+        """Build the cache key for a request's claim text and image.
+
+        Claim text is compared case-insensitively and with whitespace runs
+        collapsed, so trivially reformatted repeats share an entry. Image bytes
+        are part of the key so different images never share an entry.
+
+        The key is memoized on the request, so the lookup and the later cache
+        write hash the claim only once. The image enters the key through its
+        shared digest rather than its raw bytes.
+        """
+        cached_key: Optional[str] = request._cache_key
+        if cached_key is not None:
+            return cached_key
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(" ".join((request.claim_text or "").split()).lower().encode())
+        if request.image_data:
+            digest.update(b"\0")
+            digest.update(FactCheckPipeline._image_digest(request))
+        cache_key = digest.hexdigest()
+        request._cache_key = cache_key
+        return cache_key
+
+    @staticmethod
+    def _image_digest(request: FactCheckRequest) -> bytes:
+        """Return the request image's digest, hashing the bytes only once."""
+        cached_digest: Optional[bytes] = request._image_digest
+        if cached_digest is not None:
+            return cached_digest
+
+        digest: bytes = hashlib.blake2b(request.image_data, digest_size=16).digest()
+        request._image_digest = digest
+        return digest
+
+    def _store_local(self, cache_key: str, response: FactCheckResponse) -> None:
+        """Keep a response in the in-process LRU, evicting the oldest entry."""
+        self._local_cache[cache_key] = (
+            time.monotonic() + self.LOCAL_CACHE_TTL_SECONDS,
+            response,
+        )
+        self._local_cache.move_to_end(cache_key)
+        if len(self._local_cache) > self.LOCAL_CACHE_SIZE:
+            self._local_cache.popitem(last=False)
 
     @log_stage("Claim Extraction")
     async def _extract_claims(self, request: FactCheckRequest) -> List[ExtractedClaim]:
@@ -145,18 +359,40 @@ class FactCheckPipeline(IPipeline):
         5. Return all extracted claims in the order: main, quoted, quoted-within-quoted (Note: only the main claim is mandatory, the rest are optional)
         """
         claims: List[ExtractedClaim] = []
-        
-        # Step 1: Extract text claim if text input exists
-        if request.claim_text:
-            text_claim = await self._extract_text_claim(request.claim_text)
-            if text_claim:
-                claims.append(text_claim)
-        
-        # Step 2: Process image if present
-        if request.image_data:
-            image_claims = await self._process_image_input(request.image_data)
-            claims.extend(image_claims)
-        
+
+        # Steps 1 and 2 are independent, so on multimodal requests text and
+        # image extraction run concurrently; gather keeps the text claim
+        # ahead of image claims. A single modality is awaited directly.
+        if request.claim_text and request.image_data:
+            outcomes = await asyncio.gather(
+                self._extract_text_claim(request.claim_text),
+                self._process_image_input(
+                    request.image_data, image_hash=self._image_digest(request)
+                ),
+                return_exceptions=True,
+            )
+        elif request.claim_text:
+            outcomes = [await self._extract_text_claim(request.claim_text)]
+        else:
+            outcomes = [
+                await self._process_image_input(
+                    request.image_data, image_hash=self._image_digest(request)
+                )
+            ]
+
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                # One failed branch must not discard the other's claims
+                logger.warning(
+                    "Claim extraction branch failed: %s",
+                    outcome,
+                    exc_info=outcome,
+                )
+            elif isinstance(outcome, list):
+                claims.extend(outcome)
+            elif outcome:
+                claims.append(outcome)
+
         # Step 3: Return text claim if available, otherwise return first image claim
         if claims:
             return claims
@@ -169,53 +405,54 @@ class FactCheckPipeline(IPipeline):
         try:
             return await self.text_extractor.extract(claim_text, None)
         except Exception as e:
-            logger.warning(f"TextExtractor failed: {str(e)}", exc_info=True)
+            logger.warning("TextExtractor failed: %s", e, exc_info=True)
             return None
     
     async def _process_image_input(
-        self, image_data: bytes
+        self, image_data: bytes, image_hash: Optional[bytes] = None
     ) -> List[ExtractedClaim]:
         """Process image input following workflow decisions.
-        
+
+        Args:
+            image_data: Raw image bytes
+            image_hash: Precomputed blake2b digest of image_data, if the
+                caller already has one
+
         Returns list of ExtractedClaim objects from image processing.
         """
         claims: List[ExtractedClaim] = []
-        
+        if image_hash is None:
+            image_hash = hashlib.blake2b(image_data, digest_size=16).digest()
+        if self._is_known_non_text_image(image_hash):
+            return [self._create_error_claim("Image does not contain readable text")]
+
         try:
-            # Check if this is a text image
-            is_text_image = await self.image_handler.detect_text_image(image_data)
-            
-            if not is_text_image:
+            # One analysis pass answers both questions and separates nesting
+            analysis = await self.image_handler.analyze(image_data)
+
+            if not analysis.is_text_image:
                 # Not a text image - return error as no text detected
+                self._remember_non_text_image(image_hash)
                 error_claim = self._create_error_claim(
                     "Image does not contain readable text"
                 )
                 claims.append(error_claim)
                 return claims
-            
-            # It's a text image - check for nesting
-            has_nested_image = await self.image_handler.detect_nested_image(image_data)
-            
-            if has_nested_image:
-                # Nested image case: separate and extract from both
+
+            if analysis.has_nested:
+                # Nested image case: extract from both separated images
                 # TODO: Need to decide the strategy to handle this
-                top_image, inside_image = (
-                    await self.image_handler.separate_nested_image(image_data)
-                )
-                
-                # Extract from top image
-                top_claim = await self.text_image_extractor.extract_from_top_image(
-                    top_image
+                top_image, inside_image = analysis.top, analysis.inside
+
+                # Extract from top and inside images concurrently
+                top_claim, inside_claim = await asyncio.gather(
+                    self.text_image_extractor.extract_from_top_image(top_image),
+                    self.text_image_extractor.extract_from_inside_image(
+                        inside_image
+                    ),
                 )
                 if top_claim:
                     claims.append(top_claim)  # Output C
-                
-                # Extract from inside image
-                inside_claim = (
-                    await self.text_image_extractor.extract_from_inside_image(
-                        inside_image
-                    )
-                )
                 if inside_claim:
                     claims.append(inside_claim)  # Output D
             else:
@@ -227,11 +464,31 @@ class FactCheckPipeline(IPipeline):
                     claims.append(image_claim)  # Output B
         except Exception as e:
             logger.warning(
-                f"Image processing failed: {str(e)}", exc_info=True
+                "Image processing failed: %s", e, exc_info=True
             )
         
         return claims
     
+    def _is_known_non_text_image(self, image_key: bytes) -> bool:
+        """Return whether the image was recently found to contain no text."""
+        expires_at = self._non_text_images.get(image_key)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            del self._non_text_images[image_key]
+            return False
+        self._non_text_images.move_to_end(image_key)
+        return True
+
+    def _remember_non_text_image(self, image_key: bytes) -> None:
+        """Record a non-text image, evicting the oldest entry."""
+        self._non_text_images[image_key] = (
+            time.monotonic() + self.NON_TEXT_IMAGE_TTL_SECONDS
+        )
+        self._non_text_images.move_to_end(image_key)
+        if len(self._non_text_images) > self.NON_TEXT_IMAGE_CACHE_SIZE:
+            self._non_text_images.popitem(last=False)
+
     def _create_error_claim(self, error_message: str) -> ExtractedClaim:
         """Create an error ExtractedClaim when extraction fails."""
         return ExtractedClaim(
@@ -254,100 +511,219 @@ class FactCheckPipeline(IPipeline):
         2. If 'where' answer exists, reorder sources
         3. Search each source using 'who' and 'what' answers until match found
         4. Record confidence based on search results
+
+        Claims are independent, so they are verified concurrently (at most
+        CLAIM_CONCURRENCY_LIMIT at a time). Confidence is recorded for each
+        claim as soon as its verification finishes, while other claims are
+        still searching; the returned results keep the claims' order.
         """
+        claim_results_by_index: List[List[SearchResult]] = [[] for _ in claims]
+
+        async for index, outcome in self._verify_claims_stream(claims):
+            claim = claims[index]
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    "Verification failed for claim: %s",
+                    outcome,
+                    exc_info=outcome,
+                )
+                self._record_no_confidence(claim)
+                continue
+            if outcome is None:
+                # No structured who/what → cannot verify; record no confidence
+                self._record_no_confidence(claim)
+                continue
+
+            # Step 6: Record confidence based on whether a match was found
+            claim_results, match_found = outcome
+            self._record_confidence_from_match(claim, claim_results, match_found)
+            claim_results_by_index[index] = claim_results
+
+        # Collect all results in claim order
         all_search_results: List[SearchResult] = []
+        for claim_results in claim_results_by_index:
+            all_search_results.extend(claim_results)
+        return all_search_results
 
-        # Step 0: Determine default source order from configured sequence numbers
-        # Filter out sources with negative sequence values (they are disabled)
-        source_order = sorted(
-            [
-                key
-                for key in EXTERNAL_SOURCES.keys()
-                if EXTERNAL_SOURCES[key].sequence >= 0
-            ],
-            key=lambda key: EXTERNAL_SOURCES[key].sequence,
-        )
+    async def _verify_claims_stream(
+        self, claims: List[ExtractedClaim]
+    ) -> AsyncIterator[
+        Tuple[int, Union[Optional[Tuple[List[SearchResult], bool]], Exception]]
+    ]:
+        """Verify claims concurrently, yielding each outcome as it completes.
+
+        Yields:
+            Tuples of (claim index, outcome), in completion order. The outcome
+            is what _verify_one_claim returned, or the exception it raised.
+        """
+        semaphore = asyncio.Semaphore(self.CLAIM_CONCURRENCY_LIMIT)
+
+        async def verify(
+            index: int, claim: ExtractedClaim
+        ) -> Tuple[
+            int, Union[Optional[Tuple[List[SearchResult], bool]], Exception]
+        ]:
+            try:
+                return index, await self._verify_one_claim(
+                    claim, _DEFAULT_SOURCE_ORDER, semaphore
+                )
+            except Exception as exc:
+                return index, exc
 
-        for claim in claims:
-            # Step 1: Check if both 'who' and 'what' answers are present
-            who_a: Optional[ClaimQuestion] = next(
-                (q for q in claim.questions if q.question_type == "who"),
-                None,
-            )
-            what_a: Optional[ClaimQuestion] = next(
-                (q for q in claim.questions if q.question_type == "what"),
-                None,
-            )
+        tasks = [
+            asyncio.create_task(verify(index, claim))
+            for index, claim in enumerate(claims)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Only reached with unfinished tasks if the consumer stops early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _verify_one_claim(
+        self,
+        claim: ExtractedClaim,
+        source_order: Tuple[str, ...],
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[Tuple[List[SearchResult], bool]]:
+        """Search external sources for a single claim.
+
+        Returns:
+            Tuple of (search results, match_found), or None when the claim has
+            no 'who'/'what' answers to search with.
+        """
+        # Index questions by type in one pass; the first of each type wins
+        q_by_type: dict[str, ClaimQuestion] = {}
+        for question in claim.questions:
+            q_by_type.setdefault(question.question_type, question)
 
-            if not who_a or not what_a:
-                # No structured who/what → cannot verify; record no confidence
-                self._record_no_confidence(claim)
-                continue
+        # Step 1: Check if both 'who' and 'what' answers are present
+        who_a = q_by_type.get("who")
+        what_a = q_by_type.get("what")
 
-            # Step 2: Get 'where' answer if present
-            where_a: Optional[ClaimQuestion] = next(
-                (q for q in claim.questions if q.question_type == "where"),
-                None,
-            )
+        if not who_a or not what_a:
+            return None
+
+        # Step 2: Get 'where' answer if present
+        where_a = q_by_type.get("where")
+
+        # Step 3: Determine source order (reorder if 'where' matches a source)
+        claim_source_order = source_order
+        if where_a and where_a.answer_text:
+            where_platform = _PLATFORM_BY_LOWER.get(where_a.answer_text.lower())
+            # Only boost sources that are in the (enabled) order
+            if where_platform in source_order:
+                claim_source_order = (
+                    where_platform,
+                    *(p for p in source_order if p != where_platform),
+                )
 
-            # Step 3: Determine source order (reorder if 'where' matches a source)
-            claim_source_order = list(source_order)
-            if where_a and where_a.answer_text:
-                where_answer_lower = where_a.answer_text.lower()
-                for platform in list(claim_source_order):
-                    config = EXTERNAL_SOURCES[platform]
-                    # Only reorder if the matched source is enabled (non-negative sequence)
-                    if (
-                        platform.lower() == where_answer_lower
-                        and config.sequence >= 0
-                    ):
-                        claim_source_order.remove(platform)
-                        claim_source_order.insert(0, platform)
-                        break
-
-            # Step 4: Build search query and params
-            # TODO: Revisit if search query is to be formed here or within the search function
-            search_query = f"{who_a.answer_text} {what_a.answer_text}"
-            query_params: dict[str, str] = {
+        # Step 4: Build search query and params
+        # TODO: Revisit if search query is to be formed here or within the search function
+        search_query = f"{who_a.answer_text} {what_a.answer_text}"
+        # One read-only mapping is shared by every source's concurrent search
+        query_params: Mapping[str, str] = MappingProxyType(
+            {
                 "who": who_a.answer_text,
                 "what": what_a.answer_text,
+                **(
+                    {"where": where_a.answer_text}
+                    if where_a and where_a.answer_text
+                    else {}
+                ),
+            }
+        )
+
+        # Step 5: Search all sources concurrently until a match is found
+        match_found = False
+        claim_results: List[SearchResult] = []
+
+        async with semaphore:
+            priorities = {
+                asyncio.create_task(
+                    self._search_source(platform, search_query, query_params),
+                    name=platform,
+                ): priority
+                for priority, platform in enumerate(claim_source_order)
             }
-            if where_a and where_a.answer_text:
-                query_params["where"] = where_a.answer_text
-
-            # Step 5: Search each source until match found (match logic TBD)
-            match_found = False
-            claim_results: List[SearchResult] = []
-
-            for platform in claim_source_order:
-                try:
-                    searcher = get_searcher(platform)
-                    results = await searcher.search(search_query, query_params)
-                    claim_results.extend(results)
-
-                    # TODO: Implement real match-detection logic
-                    # For now, keep match_found as False so confidence logic
-                    # will treat this as "no decisive match".
-                    match_found = False
-
-                    if match_found:
-                        break
-                except Exception as exc:
-                    logger.warning(
-                        "Search failed for platform '%s': %s",
-                        platform,
-                        str(exc),
-                        exc_info=True,
+            # Results slotted by source priority; None while still pending
+            source_results: List[Optional[List[SearchResult]]] = [None] * len(
+                priorities
+            )
+            pending = set(priorities)
+            try:
+                while pending and not match_found:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
                     )
-                    continue
+                    for task in done:
+                        source_results[priorities[task]] = task.result()
+                    # A match only counts once every higher-priority source
+                    # has answered, as it would in a sequential walk
+                    for priority, results in enumerate(source_results):
+                        if results is None:
+                            break
+                        if self._results_match_claim(results):
+                            match_found = True
+                            # Lower-priority sources would not have been asked
+                            del source_results[priority + 1 :]
+                            break
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for results in source_results:
+            if results:
+                claim_results.extend(results)
+
+        return claim_results, match_found
+
+    async def _search_source(
+        self, platform: str, search_query: str, query_params: Mapping[str, str]
+    ) -> List[SearchResult]:
+        """Search one external source, returning no results on failure.
 
-            # Step 6: Record confidence based on whether a match was found
-            self._record_confidence_from_match(claim, claim_results, match_found)
+        A search running past the source's search_timeout_s counts as a
+        failure. The platform's own semaphore is taken before the shared one, so a
+        saturated platform queues without holding slots other platforms need.
+        """
+        platform_sem = self._platform_sems.get(platform)
+        if platform_sem is None:
+            platform_sem = self._platform_sems[platform] = asyncio.Semaphore(
+                self.PLATFORM_SEARCH_LIMIT
+            )
+        timeout_s = EXTERNAL_SOURCES[platform].search_timeout_s
+        try:
+            searcher = get_searcher(platform)
+            async with platform_sem, self._search_sem:
+                return await asyncio.wait_for(
+                    searcher.search(search_query, query_params), timeout=timeout_s
+                )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Search timed out for platform '%s' after %.1fs", platform, timeout_s
+            )
+            return []
+        except Exception as exc:
+            logger.warning(
+                "Search failed for platform '%s': %s",
+                platform,
+                exc,
+                exc_info=True,
+            )
+            return []
 
-            # Collect all results
-            all_search_results.extend(claim_results)
+    def _results_match_claim(self, results: List[SearchResult]) -> bool:
+        """Decide whether one source's results decisively match the claim.
 
-        return all_search_results
+        TODO: Implement real match-detection logic. For now nothing matches,
+        so confidence logic treats every claim as "no decisive match".
+        """
+        return False
 
     def _record_no_confidence(self, claim: ExtractedClaim) -> None:
         """Record no confidence in the claim and all its component questions.
@@ -359,9 +735,10 @@ class FactCheckPipeline(IPipeline):
         #for question in claim.questions:
         #    question.confidence = 0.0
 
-        metadata = dict(claim.metadata) if claim.metadata is not None else {}
-        metadata["verification_status"] = "no_evidence"
-        claim.metadata = metadata
+        # The pipeline owns the claim here, so its metadata is updated in place
+        if claim.metadata is None:
+            claim.metadata = {}
+        claim.metadata["verification_status"] = "no_evidence"
 
     def _record_confidence_from_match(
         self,
@@ -383,29 +760,29 @@ class FactCheckPipeline(IPipeline):
             return
 
         # TODO: Check if boosting is needed
-        # Boost key components when we believe a match exists.
-        has_questions = bool(claim.questions)
+        # Boost key components when we believe a match exists. Confidences
+        # are collected in the same pass for the claim-level mean.
+        confidences: List[float] = []
         for question in claim.questions:
-            if question.question_type in ("who", "what", "where"):
+            if question.question_type in _CORE_QUESTION_TYPES:
                 question.confidence = 1.0
             else:
                 # Non-core components get a moderate default; this will be
                 # replaced later with result-driven scoring.
                 if question.confidence < 0.5:
                     question.confidence = 0.5
+            confidences.append(question.confidence)
 
-        if has_questions:
-            claim.confidence = sum(
-                q.confidence for q in claim.questions
-            ) / len(claim.questions)
+        if confidences:
+            claim.confidence = sum(confidences) / len(confidences)
         else:
             # Fallback if no structured questions exist
             claim.confidence = 1.0
 
-        metadata = dict(claim.metadata) if claim.metadata is not None else {}
-        metadata["verification_status"] = "matched"
-        metadata["result_count"] = len(search_results)
-        claim.metadata = metadata
+        if claim.metadata is None:
+            claim.metadata = {}
+        claim.metadata["verification_status"] = "matched"
+        claim.metadata["result_count"] = len(search_results)
 
     @log_stage("Response Generation")
     async def _generate_response(
@@ -413,13 +790,13 @@ class FactCheckPipeline(IPipeline):
         request: FactCheckRequest,
         claims: List[ExtractedClaim],
         results: List[SearchResult],
-        start_time: datetime,
+        start_ns: int,
     ) -> FactCheckResponse:
         """Generate fact-check verdict and explanation.
         
         Mock implementation returns properly constructed FactCheckResponse for orchestration testing.
         """
-        processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         # Mock evidence construction
         # TODO: Handle all claims, not only claims[0]
@@ -430,51 +807,51 @@ class FactCheckPipeline(IPipeline):
             confidence=0.75,
         )
         
-        # Mock reference construction
-        reference = Reference(
-            title="Mock Source",
-            url="https://mock.source/article",
-            snippet="This is a mock reference snippet",
-            external_source="news",
-        )
-        
-        # Create response with proper typing
-        response = FactCheckResponse(
-            request_id=request.request_id or str(uuid.uuid4()),
-            claim_id=str(uuid.uuid4()),
-            verdict=VerdictEnum.MIXED,
-            confidence=0.75,
-            evidence=[evidence],
-            references=[reference],
-            explanation="Mock explanation: This claim contains both accurate and inaccurate elements.",
-            search_queries_used=["mock query 1", "mock query 2"],
-            cached=False,
-            processing_time_ms=processing_time_ms,
-            timestamp=datetime.now(),
+        # Only the per-request fields are filled in; the template was
+        # validated once at import. List fields and their references are
+        # copied so responses never share them.
+        response = _MOCK_RESPONSE_TEMPLATE.model_copy(
+            update={
+                "request_id": request.request_id,
+                "claim_id": uuid.uuid4().hex,
+                "evidence": [evidence],
+                "references": [
+                    ref.model_copy() for ref in _MOCK_RESPONSE_TEMPLATE.references
+                ],
+                "search_queries_used": list(
+                    _MOCK_RESPONSE_TEMPLATE.search_queries_used
+                ),
+                "processing_time_ms": processing_time_ms,
+                "timestamp": datetime.now(),
+            }
         )
         return response
 
     @log_stage("Cache Storage")
-    async def _cache_response(self, response: FactCheckResponse) -> None:
-        """Store response in cache using claim text as key.
-        
-        Uses claim text as cache key for consistency with cache lookup,
-        ensuring same claims return cached results.
+    async def _cache_response(
+        self, request: FactCheckRequest, response: FactCheckResponse
+    ) -> None:
+        """Store response in cache under the request's cache key.
+
+        Uses the same key as _check_cache, so a repeated claim is served from
+        cache. A copy is stored, so later changes to the caller's response do
+        not reach the cache.
         """
-        # Note: Claim text is extracted from the original request
-        # In practice, we'd pass it through or reconstruct from response evidence
-        # For now, use request_id as fallback to prevent errors
-        cache_key = response.request_id
-        await self.cache.set(cache_key, response)
+        cache_key = self._cache_key(request)
+        snapshot = response.model_copy(deep=True)
+        await self.cache.set(cache_key, snapshot)
+        self._store_local(cache_key, snapshot)
 
-    async def _generate_error_response(
+    def _generate_error_response(
         self,
         request: FactCheckRequest,
         exception: Exception,
-        start_time: datetime,
+        start_ns: int,
     ) -> FactCheckResponse:
         """Generate error response with detailed debugging information."""
-        processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        # One wall-clock reading stamps both the error details and response
+        now = datetime.now()
 
         # Extract error context
         if isinstance(exception, PipelineExecutionError):
@@ -503,13 +880,13 @@ class FactCheckPipeline(IPipeline):
             error_message=error_message,
             input_parameters=input_parameters,
             traceback_summary=traceback_summary,
-            timestamp=datetime.now(),
+            timestamp=now,
         )
 
         # Create error response
         response = FactCheckResponse(
-            request_id=request.request_id or str(uuid.uuid4()),
-            claim_id=str(uuid.uuid4()),
+            request_id=request.request_id,
+            claim_id=uuid.uuid4().hex,
             verdict=VerdictEnum.ERROR,
             confidence=0.0,
             evidence=None,
@@ -518,15 +895,34 @@ class FactCheckPipeline(IPipeline):
             search_queries_used=None,
             cached=False,
             processing_time_ms=processing_time_ms,
-            timestamp=datetime.now(),
+            timestamp=now,
             error_details=error_details,
         )
         return response
 
     def _extract_traceback_summary(self, exception: Exception) -> str:
-        """Extract condensed traceback showing call chain."""
+        """Extract condensed traceback showing call chain.
+
+        The summary is memoized on the exception, so asking again for the
+        same exception does not re-format its traceback.
+        """
+        cached: Optional[str] = getattr(exception, "_tb_summary_cache", None)
+        if cached is not None:
+            return cached
+
+        # Format only the innermost frames (most relevant) instead of slicing
+        # the tail off a fully formatted traceback
         tb_lines = traceback.format_exception(
-            type(exception), exception, exception.__traceback__
+            type(exception),
+            exception,
+            exception.__traceback__,
+            limit=-TRACEBACK_SUMMARY_FRAMES,
+            chain=False,
         )
-        # Return last 5 lines (most relevant)
-        return "".join(tb_lines[-5:])
+        summary = "".join(tb_lines)
+        try:
+            exception._tb_summary_cache = summary  # type: ignore[attr-defined]
+        except Exception:
+            # Some exception types do not accept new attributes
+            pass
+        return summary
@@ -1,6 +1,6 @@
 """BlueSky API searcher (future implementation)."""
 
-from typing import List
+from typing import List, Mapping
 from factchecker.core.interfaces import BaseSearcher
 from factchecker.core.models import SearchResult
 from factchecker.logging_config import get_logger
@@ -16,7 +16,9 @@ class BlueSkySearcher(BaseSearcher):
         self.password = password
         # TODO: Initialize BlueSky API client
 
-    async def search(self, claim: str, query_params: dict) -> List[SearchResult]:
+    async def search(
+        self, claim: str, query_params: Mapping[str, str]
+    ) -> List[SearchResult]:
         """Search BlueSky for results."""
         logger.info(f"Searching BlueSky for claim: {claim[:50]}...")
 
@@ -1,6 +1,6 @@
 """Government/Official sources searcher."""
 
-from typing import List
+from typing import List, Mapping
 from datetime import datetime
 from factchecker.core.interfaces import BaseSearcher
 from factchecker.core.models import SearchResult
@@ -16,7 +16,9 @@ class GovernmentSearcher(BaseSearcher):
         self.api_key = api_key
         # TODO: Initialize government data source client (data.gov, official APIs, etc.)
 
-    async def search(self, claim: str, query_params: dict) -> List[SearchResult]:
+    async def search(
+        self, claim: str, query_params: Mapping[str, str]
+    ) -> List[SearchResult]:
         """Search government sources for results."""
         logger.info(f"Searching government sources for claim: {claim[:50]}...")
 
@@ -1,6 +1,6 @@
 """News/Commercial Media searcher."""
 
-from typing import List
+from typing import List, Mapping
 from datetime import datetime
 from factchecker.core.interfaces import BaseSearcher
 from factchecker.core.models import SearchResult
@@ -16,7 +16,9 @@ class NewsSearcher(BaseSearcher):
         self.api_key = api_key
         # TODO: Initialize news API client (NewsAPI, Bing News, etc.)
 
-    async def search(self, claim: str, query_params: dict) -> List[SearchResult]:
+    async def search(
+        self, claim: str, query_params: Mapping[str, str]
+    ) -> List[SearchResult]:
         """Search news sources for results."""
         logger.info(f"Searching news sources for claim: {claim[:50]}...")
 
@@ -1,6 +1,6 @@
 """Twitter API searcher."""
 
-from typing import List
+from typing import List, Mapping
 from datetime import datetime
 from factchecker.core.interfaces import BaseSearcher
 from factchecker.core.models import SearchResult
@@ -16,7 +16,9 @@ class TwitterSearcher(BaseSearcher):
         self.api_key = api_key
         # TODO: Initialize Twitter API client
 
-    async def search(self, claim: str, query_params: dict) -> List[SearchResult]:
+    async def search(
+        self, claim: str, query_params: Mapping[str, str]
+    ) -> List[SearchResult]:
         """Search Twitter for results."""
         logger.info(f"Searching Twitter for claim: {claim[:50]}...")
 
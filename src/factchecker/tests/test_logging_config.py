@@ -10,7 +10,9 @@ from unittest.mock import patch, MagicMock
 from factchecker.logging_config import (
     setup_logging,
     get_logger,
+    RequestIdFilter,
     request_id_var,
+    stage_timings_var,
     log_stage,
 )
 
@@ -23,6 +25,19 @@ from factchecker.logging_config import (
 class TestContextVariableInjection:
     """Tests for request_id_var context variable functionality."""
 
+    def test_filter_keeps_request_id_set_by_adapter(self):
+        """Test RequestIdFilter only fills in request_id when it is missing."""
+        request_id_var.set("context-id")
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+        tagged = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+        tagged.request_id = "adapter-id"
+
+        assert RequestIdFilter().filter(record)
+        assert RequestIdFilter().filter(tagged)
+
+        assert record.request_id == "context-id"
+        assert tagged.request_id == "adapter-id"
+
     def test_context_var_set_and_get(self):
         """Test basic context variable set and get."""
         test_id = "test-request-123"
@@ -102,7 +117,7 @@ class TestDecoratorTiming:
             await asyncio.sleep(0.01)
             return "result"
 
-        with caplog.at_level(logging.INFO):
+        with caplog.at_level(logging.DEBUG, logger="factchecker"):
             result = await sample_async_task()
 
         assert result == "result"
@@ -118,7 +133,7 @@ class TestDecoratorTiming:
             time.sleep(0.01)
             return "sync_result"
 
-        with caplog.at_level(logging.INFO):
+        with caplog.at_level(logging.DEBUG, logger="factchecker"):
             result = sample_sync_task()
 
         assert result == "sync_result"
@@ -135,7 +150,7 @@ class TestDecoratorTiming:
         async def timed_async_task():
             await asyncio.sleep(sleep_time)
 
-        with caplog.at_level(logging.INFO):
+        with caplog.at_level(logging.DEBUG, logger="factchecker"):
             await timed_async_task()
 
         # Should log completion with timing
@@ -153,7 +168,7 @@ class TestDecoratorTiming:
         def timed_sync_task():
             time.sleep(sleep_time)
 
-        with caplog.at_level(logging.INFO):
+        with caplog.at_level(logging.DEBUG, logger="factchecker"):
             timed_sync_task()
 
         assert "Stage 'Timed Sync Stage' completed" in caplog.text
@@ -168,7 +183,7 @@ class TestDecoratorTiming:
         async def quick_async():
             return "quick"
 
-        with caplog.at_level(logging.INFO):
+        with caplog.at_level(logging.DEBUG, logger="factchecker"):
             result = await quick_async()
 
         assert result == "quick"
@@ -183,13 +198,43 @@ class TestDecoratorTiming:
         def quick_sync():
             return "quick"
 
-        with caplog.at_level(logging.INFO):
+        with caplog.at_level(logging.DEBUG, logger="factchecker"):
             result = quick_sync()
 
         assert result == "quick"
         assert "Stage 'Quick Sync' started" in caplog.text
         assert "Stage 'Quick Sync' completed" in caplog.text
 
+    @pytest.mark.asyncio
+    async def test_decorator_logs_nothing_at_info(self, caplog):
+        """Test per-stage records are kept out of INFO-level logs."""
+
+        @log_stage("Quiet Stage")
+        async def quiet_task():
+            return "quiet"
+
+        with caplog.at_level(logging.INFO):
+            await quiet_task()
+
+        assert "Quiet Stage" not in caplog.text
+
+    def test_decorator_records_stage_timings(self):
+        """Test completed stages are collected into stage_timings_var."""
+        timings: dict = {}
+        token = stage_timings_var.set(timings)
+
+        @log_stage("Collected Stage")
+        def collected():
+            return "done"
+
+        try:
+            collected()
+        finally:
+            stage_timings_var.reset(token)
+
+        assert list(timings) == ["Collected Stage"]
+        assert timings["Collected Stage"] >= 0
+
 
 # ============================================================================
 # LOG FORMATTING TESTS
@@ -407,6 +452,11 @@ class TestLoggingIntegration:
         assert isinstance(logger, logging.LoggerAdapter)
         assert "factchecker.child_module" in logger.logger.name
 
+    def test_get_logger_reuses_adapter_per_name(self):
+        """Test get_logger returns one cached adapter per module name."""
+        assert get_logger("cached_module") is get_logger("cached_module")
+        assert get_logger("cached_module") is not get_logger("other_module")
+
     def test_full_logging_pipeline(self, caplog):
         """Test complete logging pipeline with context and formatting."""
         request_id = "integration-test-123"
@@ -433,7 +483,7 @@ class TestLoggingIntegration:
             await asyncio.sleep(0.01)
             return "done"
 
-        with caplog.at_level(logging.INFO):
+        with caplog.at_level(logging.DEBUG, logger="factchecker"):
             result = await integration_task()
 
         assert result == "done"
@@ -481,7 +531,7 @@ class TestEdgeCases:
         async def long_named_task():
             return "result"
 
-        with caplog.at_level(logging.INFO):
+        with caplog.at_level(logging.DEBUG, logger="factchecker"):
             result = await long_named_task()
 
         assert result == "result"
@@ -1,23 +1,36 @@
 """Component-level tests for FactCheckPipeline."""
 
+import asyncio
+import time
 import pytest
 import logging
 from unittest.mock import AsyncMock, MagicMock, call, patch
 from datetime import datetime
 import uuid
 
-from factchecker.pipeline.factcheck_pipeline import FactCheckPipeline
+from factchecker.pipeline.factcheck_pipeline import (
+    FactCheckPipeline,
+    _DEFAULT_SOURCE_ORDER,
+)
 from factchecker.core.models import (
     FactCheckRequest,
     FactCheckResponse,
     ExtractedClaim,
     VerdictEnum,
+    ClaimQuestion,
+    SearchResult,
 )
 from factchecker.core.interfaces import IPipeline
-from factchecker.logging_config import get_logger, request_id_var
+from factchecker.core.sources_config import EXTERNAL_SOURCES
+from factchecker.logging_config import (
+    TRACEBACK_SUMMARY_FRAMES,
+    get_logger,
+    request_id_var,
+)
 from factchecker.extractors.text_extractor import TextExtractor
 from factchecker.extractors.image_extractor import ImageExtractor
 from factchecker.extractors.claim_combiner import ClaimCombiner
+from factchecker.extractors.image_handler import ImageAnalysis
 from factchecker.tests.fixtures import (
     sample_request,
     sample_response,
@@ -232,11 +245,11 @@ async def test_pipeline_mock_response_generation(
     pipeline, sample_request, sample_extracted_claim
 ):
     """Test that _generate_response returns properly constructed FactCheckResponse."""
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     mock_results = []
 
     response = await pipeline._generate_response(
-        sample_request, sample_extracted_claim, mock_results, start_time
+        sample_request, sample_extracted_claim, mock_results, start_ns
     )
 
     assert isinstance(response, FactCheckResponse)
@@ -259,9 +272,9 @@ async def test_pipeline_response_has_all_required_fields(
     pipeline, sample_request, sample_extracted_claim
 ):
     """Test that response includes all required VerdictEnum values."""
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     response = await pipeline._generate_response(
-        sample_request, sample_extracted_claim, [], start_time
+        sample_request, sample_extracted_claim, [], start_ns
     )
 
     # Verify all fields from FactCheckResponse model
@@ -484,7 +497,7 @@ class TestPipeline64c:
                 results = await pipeline._search_sources(extracted)
                 assert isinstance(results, list)
 
-                response = await pipeline._generate_response(sample_request, extracted, results, datetime.now())
+                response = await pipeline._generate_response(sample_request, extracted, results, time.perf_counter_ns())
                 assert isinstance(response, FactCheckResponse)
             finally:
                 # Dump logged data at the end of the test
@@ -590,6 +603,8 @@ class TestPipeline64c:
         mock_extractors.extract.return_value = sample_extracted_claim
 
         response = await pipeline.check_claim(sample_request)
+        # The cache write runs in the background; wait for it
+        await pipeline.aclose()
 
         # Verify cache methods were called
         mock_cache.get.assert_called_once()
@@ -873,3 +888,796 @@ class TestPipeline624:
 
         # request_id should match in request and response
         assert response.request_id == request.request_id
+
+
+# ============================================================================
+# CLAIM VERIFICATION TESTS
+# ============================================================================
+
+
+def _claim_with_answers(who: str, what: str) -> ExtractedClaim:
+    return ExtractedClaim(
+        claim_text=f"{who} {what}",
+        extracted_from="text",
+        confidence=1.0,
+        raw_input_type="text_only",
+        questions=[
+            ClaimQuestion(question_type="who", answer_text=who, confidence=0.9),
+            ClaimQuestion(question_type="what", answer_text=what, confidence=0.9),
+        ],
+    )
+
+
+class _SlowSearcher:
+    """Searcher stub that tracks how many searches are in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search(self, query, params):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [
+            SearchResult(
+                external_source="twitter",
+                content=query,
+                author="tester",
+                url="https://example.com",
+                timestamp=datetime.now(),
+            )
+        ]
+
+
+class TestVerifyClaims:
+    """Tests for _verify_claims."""
+
+    @pytest.mark.asyncio
+    async def test_claims_verified_concurrently_in_order(self, pipeline):
+        """Claims are searched concurrently and results keep the claims' order."""
+        searcher = _SlowSearcher()
+        claims = [
+            _claim_with_answers("Alice", "won the race"),
+            _claim_with_answers("Bob", "lost the race"),
+        ]
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            return_value=searcher,
+        ):
+            results = await pipeline._verify_claims(claims)
+
+        assert searcher.max_in_flight == 2
+        assert [r.content for r in results] == [
+            "Alice won the race",
+            "Bob lost the race",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_claims_as_they_complete(self, pipeline):
+        """The stream yields the fastest claim first, tagged with its index."""
+
+        class _DelayedSearcher(_SlowSearcher):
+            async def search(self, query, params):
+                await asyncio.sleep(0.03 if query.startswith("Slow") else 0)
+                return await super().search(query, params)
+
+        claims = [
+            _claim_with_answers("Slow", "claim"),
+            _claim_with_answers("Fast", "claim"),
+        ]
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            return_value=_DelayedSearcher(),
+        ):
+            indices = [
+                index async for index, _ in pipeline._verify_claims_stream(claims)
+            ]
+
+        assert indices == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_searches_bounded_by_shared_semaphore(self, pipeline):
+        """No more than the shared limit of searches run at once."""
+        pipeline._search_sem = asyncio.Semaphore(1)
+        searcher = _SlowSearcher()
+        claims = [
+            _claim_with_answers("Alice", "won the race"),
+            _claim_with_answers("Bob", "lost the race"),
+        ]
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            return_value=searcher,
+        ):
+            results = await pipeline._verify_claims(claims)
+
+        assert len(results) == 2
+        assert searcher.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_source_times_out(self, pipeline):
+        """A source past its search timeout yields no results."""
+
+        class _HangingSearcher:
+            async def search(self, query, params):
+                await asyncio.sleep(10)
+
+        with patch.object(
+            EXTERNAL_SOURCES["twitter"], "search_timeout_s", 0.01
+        ), patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            return_value=_HangingSearcher(),
+        ):
+            results = await pipeline._search_source("twitter", "query", {})
+
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_claim_without_who_what_gets_no_evidence(self, pipeline):
+        """A claim missing who/what is not searched and records no evidence."""
+        searcher = _SlowSearcher()
+        claim = ExtractedClaim(
+            claim_text="Something happened",
+            extracted_from="text",
+            confidence=1.0,
+            raw_input_type="text_only",
+        )
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            return_value=searcher,
+        ):
+            results = await pipeline._verify_claims([claim])
+
+        assert results == []
+        assert searcher.max_in_flight == 0
+        assert claim.confidence == 0.0
+        assert claim.metadata["verification_status"] == "no_evidence"
+
+    @pytest.mark.asyncio
+    async def test_sources_searched_concurrently_in_priority_order(self, pipeline):
+        """All sources are raced; results stay in source priority order."""
+        searcher = _SlowSearcher()
+        claim = _claim_with_answers("Alice", "won the race")
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            return_value=searcher,
+        ):
+            claim_results, match_found = await pipeline._verify_one_claim(
+                claim, ["twitter", "news"], asyncio.Semaphore(1)
+            )
+
+        assert searcher.max_in_flight == 2
+        assert len(claim_results) == 2
+        assert match_found is False
+
+    @pytest.mark.asyncio
+    async def test_match_cancels_lower_priority_sources(self, pipeline):
+        """A match on the top source cancels and drops slower sources."""
+        fast = _SlowSearcher()
+        slow_cancelled = asyncio.Event()
+
+        class _HangingSearcher:
+            async def search(self, query, params):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    slow_cancelled.set()
+                    raise
+
+        searchers = {"twitter": fast, "news": _HangingSearcher()}
+        claim = _claim_with_answers("Alice", "won the race")
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            side_effect=searchers.__getitem__,
+        ), patch.object(pipeline, "_results_match_claim", return_value=True):
+            claim_results, match_found = await pipeline._verify_one_claim(
+                claim, ["twitter", "news"], asyncio.Semaphore(1)
+            )
+
+        assert match_found is True
+        assert [r.content for r in claim_results] == ["Alice won the race"]
+        assert slow_cancelled.is_set()
+
+
+# ============================================================================
+# CLAIM EXTRACTION TESTS
+# ============================================================================
+
+
+class TestExtractClaims:
+    """Tests for _extract_claims."""
+
+    @pytest.mark.asyncio
+    async def test_text_and_image_extracted_concurrently(self, pipeline):
+        """Text and image branches overlap; the text claim stays first."""
+        text_claim = _claim_with_answers("Alice", "won the race")
+        image_claim = _claim_with_answers("Bob", "lost the race")
+        started = []
+
+        async def extract_text(claim_text):
+            started.append("text")
+            await asyncio.sleep(0.01)
+            assert "image" in started
+            return text_claim
+
+        async def process_image(image_data, image_hash=None):
+            started.append("image")
+            await asyncio.sleep(0.01)
+            return [image_claim]
+
+        request = FactCheckRequest(
+            claim_text="Alice won the race",
+            image_data=b"fake_image_data",
+            user_id="test_user",
+        )
+        with patch.object(
+            pipeline, "_extract_text_claim", side_effect=extract_text
+        ), patch.object(
+            pipeline, "_process_image_input", side_effect=process_image
+        ):
+            claims = await pipeline._extract_claims(request)
+
+        assert claims == [text_claim, image_claim]
+
+    @pytest.mark.asyncio
+    async def test_failed_branch_keeps_other_claims(self, pipeline):
+        """An exception in one branch does not drop the other branch's claims."""
+        image_claim = _claim_with_answers("Bob", "lost the race")
+        request = FactCheckRequest(
+            claim_text="Alice won the race",
+            image_data=b"fake_image_data",
+            user_id="test_user",
+        )
+        with patch.object(
+            pipeline, "_extract_text_claim", side_effect=RuntimeError("boom")
+        ), patch.object(
+            pipeline, "_process_image_input", return_value=[image_claim]
+        ):
+            claims = await pipeline._extract_claims(request)
+
+        assert claims == [image_claim]
+
+    @pytest.mark.asyncio
+    async def test_text_only_request_skips_image_branch(self, pipeline):
+        """A text-only request never touches image processing."""
+        text_claim = _claim_with_answers("Alice", "won the race")
+        request = FactCheckRequest(claim_text="Alice won the race", user_id="u")
+
+        with patch.object(
+            pipeline, "_extract_text_claim", return_value=text_claim
+        ), patch.object(pipeline, "_process_image_input") as process_image:
+            claims = await pipeline._extract_claims(request)
+
+        assert claims == [text_claim]
+        process_image.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_nested_image_analyzed_once(self, pipeline):
+        """A nested image is analyzed in one call and its halves reused."""
+        top_claim = _claim_with_answers("Alice", "won the race")
+        inside_claim = _claim_with_answers("Bob", "lost the race")
+        pipeline.image_handler = MagicMock()
+        pipeline.image_handler.analyze = AsyncMock(
+            return_value=ImageAnalysis(
+                is_text_image=True, has_nested=True, top=b"top", inside=b"inside"
+            )
+        )
+        pipeline.text_image_extractor = MagicMock()
+        pipeline.text_image_extractor.extract_from_top_image = AsyncMock(
+            return_value=top_claim
+        )
+        pipeline.text_image_extractor.extract_from_inside_image = AsyncMock(
+            return_value=inside_claim
+        )
+
+        claims = await pipeline._process_image_input(b"fake_image_data")
+
+        assert claims == [top_claim, inside_claim]
+        pipeline.image_handler.analyze.assert_awaited_once_with(b"fake_image_data")
+        pipeline.text_image_extractor.extract_from_top_image.assert_awaited_once_with(
+            b"top"
+        )
+        pipeline.text_image_extractor.extract_from_inside_image.assert_awaited_once_with(
+            b"inside"
+        )
+
+
+    @pytest.mark.asyncio
+    async def test_non_text_image_analyzed_once(self, pipeline):
+        """A re-uploaded non-text image is rejected without re-analysis."""
+        pipeline.image_handler = MagicMock()
+        pipeline.image_handler.analyze = AsyncMock(
+            return_value=ImageAnalysis(is_text_image=False, has_nested=False)
+        )
+
+        first = await pipeline._process_image_input(b"fake_image_data")
+        second = await pipeline._process_image_input(b"fake_image_data")
+
+        assert first[0].metadata == second[0].metadata
+        assert "readable text" in second[0].metadata["error"]
+        pipeline.image_handler.analyze.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_non_text_image_entry_expires(self, pipeline):
+        """An expired non-text entry sends the image through analysis again."""
+        pipeline.image_handler = MagicMock()
+        pipeline.image_handler.analyze = AsyncMock(
+            return_value=ImageAnalysis(is_text_image=False, has_nested=False)
+        )
+        pipeline.NON_TEXT_IMAGE_TTL_SECONDS = -1
+
+        await pipeline._process_image_input(b"fake_image_data")
+        await pipeline._process_image_input(b"fake_image_data")
+
+        assert pipeline.image_handler.analyze.await_count == 2
+
+
+class _PlatformSearcher:
+    """Searcher stub whose single result names its platform."""
+
+    def __init__(self, platform):
+        self.platform = platform
+
+    async def search(self, query, params):
+        return [
+            SearchResult(
+                external_source=self.platform,
+                content=query,
+                author="tester",
+                url="https://example.com",
+                timestamp=datetime.now(),
+            )
+        ]
+
+
+class TestSourceOrder:
+    """Tests for default and 'where'-boosted source ordering."""
+
+    def test_default_source_order_skips_disabled_sources(self):
+        """The precomputed order holds enabled sources sorted by sequence."""
+        assert _DEFAULT_SOURCE_ORDER == tuple(
+            sorted(
+                (k for k, c in EXTERNAL_SOURCES.items() if c.sequence >= 0),
+                key=lambda k: EXTERNAL_SOURCES[k].sequence,
+            )
+        )
+        assert all(EXTERNAL_SOURCES[k].sequence >= 0 for k in _DEFAULT_SOURCE_ORDER)
+
+    @pytest.mark.asyncio
+    async def test_where_answer_moves_source_to_front(self, pipeline):
+        """A 'where' answer naming a source puts that source first."""
+        claim = _claim_with_answers("Alice", "won the race")
+        claim.questions.append(
+            ClaimQuestion(question_type="where", answer_text="News", confidence=0.9)
+        )
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            side_effect=_PlatformSearcher,
+        ):
+            claim_results, _ = await pipeline._verify_one_claim(
+                claim, ("twitter", "bluesky", "news"), asyncio.Semaphore(1)
+            )
+
+        assert [r.external_source for r in claim_results] == [
+            "news",
+            "twitter",
+            "bluesky",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_where_answer_for_unlisted_source_keeps_order(self, pipeline):
+        """A 'where' answer naming a source outside the order changes nothing."""
+        claim = _claim_with_answers("Alice", "won the race")
+        claim.questions.append(
+            ClaimQuestion(question_type="where", answer_text="Gov", confidence=0.9)
+        )
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            side_effect=_PlatformSearcher,
+        ):
+            claim_results, _ = await pipeline._verify_one_claim(
+                claim, ("twitter", "news"), asyncio.Semaphore(1)
+            )
+
+        assert [r.external_source for r in claim_results] == ["twitter", "news"]
+
+
+# ============================================================================
+# CACHE TESTS
+# ============================================================================
+
+
+class TestPipelineCache:
+    """Tests for cache keys and the in-process LRU."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_claim_served_from_cache(
+        self, pipeline, mock_cache, sample_request, sample_response
+    ):
+        """A stored response is found again by the same claim text."""
+        mock_cache.get.return_value = None
+
+        await pipeline._cache_response(sample_request, sample_response)
+        cached = await pipeline._check_cache(
+            FactCheckRequest(claim_text="  THE SKY IS BLUE ", user_id="other")
+        )
+
+        assert cached == sample_response
+        assert cached is not sample_response
+        mock_cache.get.assert_not_called()
+        stored_key = mock_cache.set.call_args.args[0]
+        assert stored_key == pipeline._cache_key(sample_request)
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_independent_copy(self, pipeline, mock_cache):
+        """A hit is a fresh object; the first caller's response is untouched."""
+        mock_cache.get.return_value = None
+        first = await pipeline.check_claim(
+            FactCheckRequest(claim_text="The sky is blue", user_id="u")
+        )
+        await pipeline.aclose()
+
+        second = await pipeline.check_claim(
+            FactCheckRequest(claim_text="The sky is blue", user_id="u")
+        )
+
+        assert second is not first
+        assert second.cached is True
+        assert first.cached is False
+        assert first.request_id != second.request_id
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_carries_current_request_id(self, pipeline, mock_cache):
+        """A cache hit reports the id of the request being served."""
+        mock_cache.get.return_value = None
+        await pipeline.check_claim(
+            FactCheckRequest(
+                claim_text="The sky is blue", user_id="u", request_id="req-1"
+            )
+        )
+        await pipeline.aclose()
+
+        response = await pipeline.check_claim(
+            FactCheckRequest(
+                claim_text="The sky is blue", user_id="u", request_id="req-2"
+            )
+        )
+
+        assert response.cached is True
+        assert response.request_id == "req-2"
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_hit_kept_locally(
+        self, pipeline, mock_cache, sample_request, sample_response
+    ):
+        """A hit from the shared cache is answered locally the next time."""
+        mock_cache.get.return_value = sample_response
+
+        await pipeline._check_cache(sample_request)
+        await pipeline._check_cache(sample_request)
+
+        mock_cache.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_local_entry_falls_through(
+        self, pipeline, mock_cache, sample_request, sample_response
+    ):
+        """An expired local entry is dropped and the shared cache is asked."""
+        mock_cache.get.return_value = None
+        pipeline.LOCAL_CACHE_TTL_SECONDS = -1
+
+        await pipeline._cache_response(sample_request, sample_response)
+        cached = await pipeline._check_cache(sample_request)
+
+        assert cached is None
+        mock_cache.get.assert_called_once()
+        assert pipeline._local_cache == {}
+
+    def test_local_cache_evicts_least_recently_used(self, pipeline, sample_response):
+        """The local cache never grows past LOCAL_CACHE_SIZE."""
+        pipeline.LOCAL_CACHE_SIZE = 2
+        for key in ("a", "b", "c"):
+            pipeline._store_local(key, sample_response)
+
+        assert list(pipeline._local_cache) == ["b", "c"]
+
+    def test_cache_key_ignores_case_and_whitespace(self, pipeline):
+        """Reformatted repeats of a claim share one cache key."""
+        first = FactCheckRequest(claim_text="The sky is blue", user_id="u")
+        second = FactCheckRequest(claim_text="the  SKY\nis blue", user_id="u")
+
+        assert pipeline._cache_key(first) == pipeline._cache_key(second)
+
+    def test_cache_key_memoized_on_request(self, pipeline, sample_request):
+        """The key is hashed once and reused for the same request."""
+        first = pipeline._cache_key(sample_request)
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.hashlib.blake2b"
+        ) as blake2b:
+            second = pipeline._cache_key(sample_request)
+
+        assert second == first
+        blake2b.assert_not_called()
+        assert "_cache_key" not in sample_request.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_image_hashed_once_per_request(self, pipeline):
+        """The cache key and image processing share one image digest."""
+        request = FactCheckRequest(image_data=b"fake_image_data", user_id="u")
+        pipeline._cache_key(request)
+
+        with patch.object(
+            pipeline, "_process_image_input", return_value=[]
+        ) as process_image, patch(
+            "factchecker.pipeline.factcheck_pipeline.hashlib.blake2b"
+        ) as blake2b:
+            await pipeline._extract_claims(request)
+
+        blake2b.assert_not_called()
+        process_image.assert_awaited_once_with(
+            b"fake_image_data", image_hash=request._image_digest
+        )
+
+    def test_cache_key_includes_image(self, pipeline):
+        """Requests with the same text but different images get different keys."""
+        first = FactCheckRequest(claim_text="claim", image_data=b"one", user_id="u")
+        second = FactCheckRequest(claim_text="claim", image_data=b"two", user_id="u")
+
+        assert pipeline._cache_key(first) != pipeline._cache_key(second)
+
+
+class TestRecordConfidence:
+    """Tests for confidence recording after verification."""
+
+    @pytest.mark.asyncio
+    async def test_match_boosts_core_questions_and_averages(self, pipeline):
+        """Core answers go to 1.0, others to at least 0.5, claim gets the mean."""
+        claim = _claim_with_answers("Alice", "won the race")
+        claim.questions.append(
+            ClaimQuestion(question_type="when", answer_text="today", confidence=0.2)
+        )
+        search_results = await _PlatformSearcher("twitter").search("q", {})
+
+        pipeline._record_confidence_from_match(claim, search_results, True)
+
+        assert [q.confidence for q in claim.questions] == [1.0, 1.0, 0.5]
+        assert claim.confidence == pytest.approx(2.5 / 3)
+        assert claim.metadata["verification_status"] == "matched"
+        assert claim.metadata["result_count"] == 1
+
+
+class TestSpeculativeExtraction:
+    """Tests for running claim extraction alongside the cache lookup."""
+
+    @pytest.mark.asyncio
+    async def test_extraction_overlaps_cache_lookup(
+        self, pipeline, mock_cache, sample_request
+    ):
+        """Extraction starts before the cache lookup has answered."""
+        events = []
+
+        async def slow_get(key):
+            events.append("cache start")
+            await asyncio.sleep(0.01)
+            events.append("cache done")
+            return None
+
+        async def extract(request):
+            events.append("extract start")
+            return [_claim_with_answers("Alice", "won the race")]
+
+        mock_cache.get.side_effect = slow_get
+        with patch.object(pipeline, "_extract_claims", side_effect=extract), patch(
+            "factchecker.pipeline.factcheck_pipeline.get_searcher",
+            side_effect=_PlatformSearcher,
+        ):
+            response = await pipeline.check_claim(sample_request)
+
+        assert response.verdict != VerdictEnum.ERROR
+        assert events.index("extract start") < events.index("cache done")
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_cancels_extraction(
+        self, pipeline, mock_cache, sample_request, sample_response
+    ):
+        """A cache hit cancels the in-flight extraction."""
+        cancelled = asyncio.Event()
+
+        async def hanging_extract(request):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def get(key):
+            await asyncio.sleep(0)
+            return sample_response
+
+        mock_cache.get.side_effect = get
+        with patch.object(pipeline, "_extract_claims", side_effect=hanging_extract):
+            response = await pipeline.check_claim(sample_request)
+
+        assert response.cached is True
+        assert cancelled.is_set()
+
+
+class TestGenerateResponse:
+    """Tests for the templated mock response."""
+
+    @pytest.mark.asyncio
+    async def test_responses_do_not_share_mutable_fields(self, pipeline):
+        """Each response gets its own ids and list fields."""
+        claims = [_claim_with_answers("Alice", "won the race")]
+        first_request = FactCheckRequest(
+            claim_text="first", user_id="u", request_id="req-1"
+        )
+        second_request = FactCheckRequest(
+            claim_text="second", user_id="u", request_id="req-2"
+        )
+
+        first = await pipeline._generate_response(
+            first_request, claims, [], time.perf_counter_ns()
+        )
+        second = await pipeline._generate_response(
+            second_request, claims, [], time.perf_counter_ns()
+        )
+
+        assert (first.request_id, second.request_id) == ("req-1", "req-2")
+        assert first.claim_id != second.claim_id
+        assert first.references is not second.references
+        assert first.search_queries_used is not second.search_queries_used
+        assert first.verdict == VerdictEnum.MIXED
+        assert first.references[0].title == "Mock Source"
+
+
+    @pytest.mark.asyncio
+    async def test_mutated_reference_does_not_leak(self, pipeline):
+        """Changing a returned reference leaves later responses untouched."""
+        claims = [_claim_with_answers("Alice", "won the race")]
+        request = FactCheckRequest(claim_text="first", user_id="u")
+
+        first = await pipeline._generate_response(
+            request, claims, [], time.perf_counter_ns()
+        )
+        first.references[0].title = "Changed"
+        second = await pipeline._generate_response(
+            request, claims, [], time.perf_counter_ns()
+        )
+
+        assert second.references[0] is not first.references[0]
+        assert second.references[0].title == "Mock Source"
+
+class TestTracebackSummary:
+    """Tests for the condensed traceback in error details."""
+
+    def test_summary_keeps_innermost_frames(self, pipeline):
+        """Only the innermost frames and the exception line are kept."""
+
+        def recurse(depth):
+            if depth == 0:
+                raise ValueError("deep failure")
+            recurse(depth - 1)
+
+        try:
+            recurse(20)
+        except ValueError as exc:
+            summary = pipeline._extract_traceback_summary(exc)
+
+        assert summary.count('File "') == TRACEBACK_SUMMARY_FRAMES
+        assert "raise ValueError" in summary
+        assert summary.rstrip().endswith("ValueError: deep failure")
+
+
+class TestBackgroundCacheWrite:
+    """Tests for writing responses to the cache off the critical path."""
+
+    @pytest.mark.asyncio
+    async def test_response_returned_before_cache_write(
+        self, pipeline, mock_cache, sample_request
+    ):
+        """check_claim returns without waiting for the cache write."""
+        write_started = asyncio.Event()
+        release_write = asyncio.Event()
+
+        async def slow_set(key, value):
+            write_started.set()
+            await release_write.wait()
+
+        mock_cache.get.return_value = None
+        mock_cache.set.side_effect = slow_set
+
+        response = await pipeline.check_claim(sample_request)
+
+        assert response.verdict != VerdictEnum.ERROR
+        assert len(pipeline._pending_writes) == 1
+
+        release_write.set()
+        await pipeline.aclose()
+
+        assert write_started.is_set()
+        assert pipeline._pending_writes == set()
+
+    @pytest.mark.asyncio
+    async def test_failed_cache_write_does_not_affect_response(
+        self, pipeline, mock_cache, sample_request
+    ):
+        """A failing background write is logged, not raised."""
+        mock_cache.get.return_value = None
+        mock_cache.set.side_effect = RuntimeError("cache down")
+
+        response = await pipeline.check_claim(sample_request)
+        await pipeline.aclose()
+
+        assert response.verdict != VerdictEnum.ERROR
+        assert pipeline._pending_writes == set()
+
+    def test_summary_memoized_on_exception(self, pipeline):
+        """A second request for the same exception skips formatting."""
+        try:
+            raise ValueError("once")
+        except ValueError as exc:
+            error = exc
+
+        first = pipeline._extract_traceback_summary(error)
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.traceback.format_exception"
+        ) as format_exception:
+            second = pipeline._extract_traceback_summary(error)
+
+        assert second == first
+        format_exception.assert_not_called()
+
+
+class TestPipelineConstruction:
+    """Tests for default extractor construction."""
+
+    def test_supplied_image_components_skip_defaults(self):
+        """Supplied image components are used and no defaults are built."""
+        image_handler = MagicMock()
+        text_image_extractor = MagicMock()
+
+        with patch(
+            "factchecker.pipeline.factcheck_pipeline.ImageHandler"
+        ) as default_handler, patch(
+            "factchecker.pipeline.factcheck_pipeline.TextImageExtractor"
+        ) as default_extractor:
+            pipeline = FactCheckPipeline(
+                cache=AsyncMock(),
+                extractors={
+                    "image_handler": image_handler,
+                    "text_image_extractor": text_image_extractor,
+                },
+                searchers=AsyncMock(),
+                processors=AsyncMock(),
+            )
+
+        assert pipeline.image_handler is image_handler
+        assert pipeline.text_image_extractor is text_image_extractor
+        default_handler.assert_not_called()
+        default_extractor.assert_not_called()
+
+    @pytest.mark.parametrize("value", ["abc", "0", "-3", ""])
+    def test_invalid_search_limit_falls_back_to_default(self, monkeypatch, value):
+        """Malformed or non-positive search limits use the default."""
+        monkeypatch.setenv("FC_MAX_CONCURRENT_SEARCHES", value)
+
+        assert (
+            FactCheckPipeline._max_concurrent_searches()
+            == FactCheckPipeline.DEFAULT_MAX_CONCURRENT_SEARCHES
+        )
+
+    def test_search_limit_read_from_environment(self, monkeypatch):
+        """A valid FC_MAX_CONCURRENT_SEARCHES value is used as given."""
+        monkeypatch.setenv("FC_MAX_CONCURRENT_SEARCHES", "8")
+
+        assert FactCheckPipeline._max_concurrent_searches() == 8